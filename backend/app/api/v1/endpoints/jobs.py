@@ -1,9 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer, raiseload
 from typing import List, Optional
-from app.core.database import get_db
-from app.models.resume import JobListing
+from app.core.database import get_db, get_or_404
+from app.models.resume import JobListing, JobMatch
 from app.schemas.resume import JobListing as JobListingSchema, JobListingCreate
+from app.services.match_cache import match_cache
+from app.services.job_index import job_index
 import logging
 
 logger = logging.getLogger(__name__)
@@ -12,13 +16,17 @@ router = APIRouter()
 @router.post("/", response_model=JobListingSchema)
 async def create_job_listing(
     job_data: JobListingCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     try:
         db_job = JobListing(**job_data.dict())
+        vector = job_index.embed_job(db_job)
+        db_job.embedding = job_index.to_bytes(vector)
         db.add(db_job)
-        db.commit()
-        db.refresh(db_job)
+        await db.commit()
+        await db.refresh(db_job)
+        job_index.upsert(db_job.id, vector)
+        match_cache.invalidate_jobs()
         return db_job
     except Exception as e:
         logger.error(f"Failed to create job listing: {e}")
@@ -26,54 +34,66 @@ async def create_job_listing(
 
 @router.get("/", response_model=List[JobListingSchema])
 async def get_job_listings(
+    response: Response,
     skip: int = 0,
-    limit: int = 100,
+    limit: int = Query(50, ge=1, le=200),
+    after_id: Optional[int] = None,
     company: Optional[str] = None,
     location: Optional[str] = None,
     job_type: Optional[str] = None,
     remote: Optional[str] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    query = db.query(JobListing)
+    # The embedding blob is only needed by the in-memory index, never by the response
+    query = select(JobListing).options(defer(JobListing.embedding), raiseload("*"))
     
     if company:
-        query = query.filter(JobListing.company.ilike(f"%{company}%"))
+        query = query.where(JobListing.company.ilike(f"%{company}%"))
     if location:
-        query = query.filter(JobListing.location.ilike(f"%{location}%"))
+        query = query.where(JobListing.location.ilike(f"%{location}%"))
     if job_type:
-        query = query.filter(JobListing.job_type == job_type)
+        query = query.where(JobListing.job_type == job_type)
     if remote:
-        query = query.filter(JobListing.remote == remote)
+        query = query.where(JobListing.remote == remote)
     
-    jobs = query.offset(skip).limit(limit).all()
+    # Keyset pagination stays O(limit) at any depth; skip is kept for older clients
+    if after_id is not None:
+        query = query.where(JobListing.id > after_id)
+    else:
+        query = query.offset(skip)
+    
+    result = await db.execute(query.order_by(JobListing.id).limit(limit))
+    jobs = result.scalars().all()
+    if len(jobs) == limit:
+        response.headers["X-Next-Cursor"] = str(jobs[-1].id)
     return jobs
 
 @router.get("/{job_id}", response_model=JobListingSchema)
 async def get_job_listing(
     job_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    job = db.query(JobListing).filter(JobListing.id == job_id).first()
-    if not job:
-        raise HTTPException(status_code=404, detail="Job listing not found")
+    job = await get_or_404(db, JobListing, job_id, detail="Job listing not found")
     return job
 
 @router.put("/{job_id}", response_model=JobListingSchema)
 async def update_job_listing(
     job_id: int,
     job_data: JobListingCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    job = db.query(JobListing).filter(JobListing.id == job_id).first()
-    if not job:
-        raise HTTPException(status_code=404, detail="Job listing not found")
+    job = await get_or_404(db, JobListing, job_id, detail="Job listing not found")
     
     try:
         for field, value in job_data.dict().items():
             setattr(job, field, value)
+        vector = job_index.embed_job(job)
+        job.embedding = job_index.to_bytes(vector)
         
-        db.commit()
-        db.refresh(job)
+        await db.commit()
+        await db.refresh(job)
+        job_index.upsert(job.id, vector)
+        match_cache.invalidate_jobs()
         return job
     except Exception as e:
         logger.error(f"Failed to update job listing: {e}")
@@ -82,15 +102,18 @@ async def update_job_listing(
 @router.delete("/{job_id}")
 async def delete_job_listing(
     job_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    job = db.query(JobListing).filter(JobListing.id == job_id).first()
-    if not job:
-        raise HTTPException(status_code=404, detail="Job listing not found")
+    job = await get_or_404(db, JobListing, job_id, detail="Job listing not found")
     
     try:
-        db.delete(job)
-        db.commit()
+        await db.execute(
+            delete(JobMatch).where(JobMatch.job_listing_id == job_id).execution_options(synchronize_session=False)
+        )
+        await db.delete(job)
+        await db.commit()
+        job_index.remove(job_id)
+        match_cache.invalidate_jobs()
         return {"message": "Job listing deleted successfully"}
     except Exception as e:
         logger.error(f"Failed to delete job listing: {e}")
@@ -1,35 +1,36 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
-from sqlalchemy.orm import Session
+from sqlalchemy import select, delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, raiseload, defer
 from typing import List
-from app.core.database import get_db
+from app.core.database import get_db, get_or_404, ensure_owned
 from app.models.resume import Resume, JobListing, JobMatch
 from app.schemas.resume import JobMatchResponse
 from app.services.resume_service import resume_service
+from app.services.metrics_service import track_request_metrics, track_job_matching
+from app.services.match_cache import match_cache, fetch_jobs_version
+from app.services.job_index import job_index
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 @router.post("/{resume_id}", response_model=List[JobMatchResponse])
+@track_request_metrics
+@track_job_matching
 async def find_job_matches(
     resume_id: int,
     request: Request,
     limit: int = 20,
     location: str = "US",
     use_live_jobs: bool = True,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     if not hasattr(request.state, 'user_id') or not request.state.user_id:
         raise HTTPException(status_code=401, detail="Authentication required")
     
     user_id = request.state.user_id
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == user_id
-    ).first()
-    
-    if not resume:
-        raise HTTPException(status_code=404, detail="Resume not found")
+    resume = await get_or_404(db, Resume, resume_id, user_id=user_id, detail="Resume not found")
     
     if not resume.parsed_data:
         raise HTTPException(status_code=400, detail="Resume must be parsed before finding matches")
@@ -68,45 +69,66 @@ async def find_job_matches(
             return results
         else:
             # Fallback to local job matching
-            job_listings = db.query(JobListing).all()
+            # Versioned from the database, so job writes handled by any worker make this key miss
+            jobs_version = await fetch_jobs_version(db)
+            cache_key = match_cache.make_key(resume_id, resume.parsed_data, limit, jobs_version)
+            cached_results = match_cache.get(cache_key)
+            if cached_results is not None:
+                return cached_results
             
-            job_data = []
-            for job in job_listings:
-                job_data.append({
-                    "id": job.id,
-                    "title": job.title,
-                    "company": job.company,
-                    "description": job.description,
-                    "requirements": job.requirements or "",
-                    "location": job.location,
-                    "salary_min": job.salary_min,
-                    "salary_max": job.salary_max,
-                    "job_type": job.job_type,
-                    "remote": job.remote
-                })
+            # Nearest-neighbour search over precomputed job embeddings instead of scoring every listing
+            await job_index.sync(db, jobs_version)
+            resume_vector = job_index.embed(resume_service.build_match_text(resume.parsed_data))
+            hits = job_index.search(resume_vector, limit)
+            
+            # Load only the top-K listings in one round-trip
+            ids = [job_id for job_id, _ in hits]
+            jobs_by_id = {
+                job.id: job
+                for job in (await db.execute(
+                    select(JobListing).options(defer(JobListing.embedding)).where(JobListing.id.in_(ids))
+                )).scalars()
+            }
             
-            matches = resume_service.get_matching_jobs(resume.parsed_data, job_data)
+            hits = [(job_id, score) for job_id, score in hits if job_id in jobs_by_id]
+            matching_skills = await resume_service.match_skills_async(
+                resume.parsed_data.get("skills", []),
+                [jobs_by_id[job_id].description for job_id, _ in hits]
+            )
+            top_matches = []
+            for (job_id, score), skills in zip(hits, matching_skills):
+                top_matches.append({
+                    "id": job_id,
+                    "match_score": min(max(score, 0.0), 1.0),
+                    "matching_skills": skills
+                })
             
-            db.query(JobMatch).filter(JobMatch.resume_id == resume_id).delete()
+            # Nothing in the session references the old matches, so skip ORM synchronization
+            await db.execute(
+                delete(JobMatch).where(JobMatch.resume_id == resume_id).execution_options(synchronize_session=False)
+            )
+            if top_matches:
+                # Plain mappings go out as one executemany INSERT without per-row ORM instrumentation
+                await db.execute(insert(JobMatch), [
+                    {
+                        "resume_id": resume_id,
+                        "job_listing_id": match["id"],
+                        "match_score": match["match_score"],
+                        "matching_skills": match["matching_skills"]
+                    }
+                    for match in top_matches
+                ])
             
             results = []
-            for match in matches[:limit]:
-                db_match = JobMatch(
-                    resume_id=resume_id,
-                    job_listing_id=match["id"],
-                    match_score=match["match_score"],
-                    matching_skills=match["matching_skills"]
-                )
-                db.add(db_match)
-                
-                job_listing = db.query(JobListing).filter(JobListing.id == match["id"]).first()
+            for match in top_matches:
                 results.append(JobMatchResponse(
-                    job_listing=job_listing,
+                    job_listing=jobs_by_id.get(match["id"]),
                     match_score=match["match_score"],
                     matching_skills=match["matching_skills"]
                 ))
             
-            db.commit()
+            await db.commit()
+            match_cache.set(cache_key, results)
             return results
         
     except Exception as e:
@@ -114,24 +136,23 @@ async def find_job_matches(
         raise HTTPException(status_code=500, detail="Failed to find job matches")
 
 @router.get("/{resume_id}", response_model=List[JobMatchResponse])
+@track_request_metrics
 async def get_job_matches(
     resume_id: int,
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     if not hasattr(request.state, 'user_id') or not request.state.user_id:
         raise HTTPException(status_code=401, detail="Authentication required")
     
     user_id = request.state.user_id
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == user_id
-    ).first()
-    
-    if not resume:
-        raise HTTPException(status_code=404, detail="Resume not found")
+    await ensure_owned(db, Resume, resume_id, user_id, detail="Resume not found")
     
-    matches = db.query(JobMatch).filter(JobMatch.resume_id == resume_id).all()
+    result = await db.execute(select(JobMatch).options(
+        selectinload(JobMatch.job_listing).defer(JobListing.embedding),
+        raiseload("*")
+    ).where(JobMatch.resume_id == resume_id).order_by(JobMatch.match_score.desc()))
+    matches = result.scalars().all()
     
     results = []
     for match in matches:
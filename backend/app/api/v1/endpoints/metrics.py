@@ -1,5 +1,5 @@
 from fastapi import APIRouter, Response
-from app.services.metrics_service import get_metrics
+from app.services.metrics_service import get_metrics, CONTENT_TYPE_LATEST
 import logging
 
 logger = logging.getLogger(__name__)
@@ -9,14 +9,14 @@ router = APIRouter()
 async def metrics():
     """Prometheus metrics endpoint."""
     try:
-        metrics_data = get_metrics()
+        # generate_latest() already yields bytes, so Response sends them without re-encoding
         return Response(
-            content=metrics_data,
-            media_type="text/plain"
+            content=get_metrics(),
+            media_type=CONTENT_TYPE_LATEST
         )
     except Exception as e:
         logger.error(f"Failed to get metrics: {e}")
         return Response(
-            content="# Error retrieving metrics\n",
-            media_type="text/plain"
+            content=b"# Error retrieving metrics\n",
+            media_type=CONTENT_TYPE_LATEST
         )
\ No newline at end of file
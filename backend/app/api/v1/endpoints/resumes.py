@@ -1,12 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Request
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Request, BackgroundTasks
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload
 from typing import List
 import aiofiles
 import os
-from app.core.database import get_db
-from app.models.resume import Resume
-from app.schemas.resume import Resume as ResumeSchema, ResumeCreate, ResumeParseResponse
+from app.core.database import get_db, get_or_404, AsyncSessionLocal
+from app.models.resume import Resume, JobMatch
+from app.schemas.resume import Resume as ResumeSchema, ResumeSummary, ResumeStatus, ResumeCreate, ResumeParseResponse
 from app.services.resume_service import resume_service
+from app.services.metrics_service import track_request_metrics, track_resume_parsing
 from google.cloud import storage
 from app.core.config import settings
 import logging
@@ -14,11 +18,49 @@ import logging
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-@router.post("/upload", response_model=ResumeSchema)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+_storage_client = None
+
+def get_storage_client() -> storage.Client:
+    global _storage_client
+    if _storage_client is None:
+        _storage_client = storage.Client()
+    return _storage_client
+
+def read_resume_file(file_path: str) -> bytes:
+    if file_path.startswith("gs://"):
+        bucket_name = file_path.split("/")[2]
+        blob_name = "/".join(file_path.split("/")[3:])
+        return get_storage_client().bucket(bucket_name).blob(blob_name).download_as_bytes()
+    with open(file_path, "rb") as f:
+        return f.read()
+
+async def extract_and_parse(resume_id: int):
+    """Background step after upload: pull text out of the stored file and parse it."""
+    async with AsyncSessionLocal() as db:
+        resume = await db.get(Resume, resume_id)
+        if resume is None:
+            return
+        
+        try:
+            data = await run_in_threadpool(read_resume_file, resume.file_path)
+            content, parsed_data = await resume_service.extract_and_parse_async(data, resume.filename)
+            resume.content = content
+            resume.parsed_data = parsed_data
+            resume.status = "ready"
+        except Exception as e:
+            logger.error(f"Failed to extract resume {resume_id}: {e}")
+            resume.status = "failed"
+        await db.commit()
+
+@router.post("/upload", response_model=ResumeSchema, status_code=202)
+@track_request_metrics
 async def upload_resume(
     request: Request,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     if not hasattr(request.state, 'user_id') or not request.state.user_id:
         raise HTTPException(status_code=401, detail="Authentication required")
@@ -29,14 +71,13 @@ async def upload_resume(
         raise HTTPException(status_code=400, detail="Only PDF, TXT, and DOCX files are supported")
     
     try:
-        content = await file.read()
-        
         if settings.RESUME_BUCKET_NAME:
-            client = storage.Client()
+            client = await run_in_threadpool(get_storage_client)
             bucket = client.bucket(settings.RESUME_BUCKET_NAME)
             blob_name = f"{user_id}/{file.filename}"
             blob = bucket.blob(blob_name)
-            blob.upload_from_string(content)
+            # Stream the spooled upload straight to GCS instead of buffering it in memory
+            await run_in_threadpool(blob.upload_from_file, file.file, rewind=True)
             file_path = f"gs://{settings.RESUME_BUCKET_NAME}/{blob_name}"
         else:
             upload_dir = f"/tmp/uploads/{user_id}"
@@ -44,7 +85,8 @@ async def upload_resume(
             file_path = f"{upload_dir}/{file.filename}"
             
             async with aiofiles.open(file_path, 'wb') as f:
-                await f.write(content)
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    await f.write(chunk)
         
         resume_data = ResumeCreate(
             user_id=user_id,
@@ -54,77 +96,96 @@ async def upload_resume(
         db_resume = Resume(
             user_id=resume_data.user_id,
             filename=resume_data.filename,
-            file_path=file_path
+            file_path=file_path,
+            status="processing"
         )
         
         db.add(db_resume)
-        db.commit()
-        db.refresh(db_resume)
+        await db.commit()
+        await db.refresh(db_resume)
         
+        # Extraction runs after the response is sent; clients poll /{resume_id}/status
+        background_tasks.add_task(extract_and_parse, db_resume.id)
         return db_resume
         
     except Exception as e:
         logger.error(f"Failed to upload resume: {e}")
         raise HTTPException(status_code=500, detail="Failed to upload resume")
 
-@router.get("/", response_model=List[ResumeSchema])
+@router.get("/", response_model=List[ResumeSummary])
+@track_request_metrics
 async def get_resumes(
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     if not hasattr(request.state, 'user_id') or not request.state.user_id:
         raise HTTPException(status_code=401, detail="Authentication required")
     
     user_id = request.state.user_id
-    resumes = db.query(Resume).filter(Resume.user_id == user_id).all()
+    # Skip content/parsed_data: the list view never shows them and they are the bulk of each row
+    result = await db.execute(select(Resume).options(load_only(
+        Resume.id, Resume.user_id, Resume.filename, Resume.file_path, Resume.status,
+        Resume.created_at, Resume.updated_at
+    ), raiseload("*")).where(Resume.user_id == user_id))
+    resumes = result.scalars().all()
     return resumes
 
 @router.get("/{resume_id}", response_model=ResumeSchema)
+@track_request_metrics
 async def get_resume(
     resume_id: int,
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     if not hasattr(request.state, 'user_id') or not request.state.user_id:
         raise HTTPException(status_code=401, detail="Authentication required")
     
     user_id = request.state.user_id
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == user_id
-    ).first()
+    resume = await get_or_404(db, Resume, resume_id, user_id=user_id, detail="Resume not found")
     
-    if not resume:
-        raise HTTPException(status_code=404, detail="Resume not found")
+    return resume
+
+@router.get("/{resume_id}/status", response_model=ResumeStatus)
+@track_request_metrics
+async def get_resume_status(
+    resume_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+):
+    if not hasattr(request.state, 'user_id') or not request.state.user_id:
+        raise HTTPException(status_code=401, detail="Authentication required")
+    
+    user_id = request.state.user_id
+    resume = await get_or_404(db, Resume, resume_id, user_id=user_id, detail="Resume not found")
     
     return resume
 
 @router.post("/{resume_id}/parse", response_model=ResumeParseResponse)
+@track_request_metrics
+@track_resume_parsing
 async def parse_resume(
     resume_id: int,
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     if not hasattr(request.state, 'user_id') or not request.state.user_id:
         raise HTTPException(status_code=401, detail="Authentication required")
     
     user_id = request.state.user_id
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == user_id
-    ).first()
+    resume = await get_or_404(db, Resume, resume_id, user_id=user_id, detail="Resume not found")
     
-    if not resume:
-        raise HTTPException(status_code=404, detail="Resume not found")
+    # Upload returns before extraction finishes; tell the client to retry rather than fail
+    if resume.status == "processing":
+        raise HTTPException(status_code=409, detail="Resume is still being processed")
     
     try:
         if not resume.content:
             raise HTTPException(status_code=400, detail="Resume content not available for parsing")
         
-        parsed_data = resume_service.parse_resume_content(resume.content)
+        parsed_data = await resume_service.parse_resume_content_async(resume.content)
         
         resume.parsed_data = parsed_data
-        db.commit()
+        await db.commit()
         
         return ResumeParseResponse(
             skills=parsed_data.get("skills", []),
@@ -132,44 +193,50 @@ async def parse_resume(
             contact_info=parsed_data.get("contact_info", {})
         )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to parse resume: {e}")
         raise HTTPException(status_code=500, detail="Failed to parse resume")
 
 @router.delete("/{resume_id}")
+@track_request_metrics
 async def delete_resume(
     resume_id: int,
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     if not hasattr(request.state, 'user_id') or not request.state.user_id:
         raise HTTPException(status_code=401, detail="Authentication required")
     
     user_id = request.state.user_id
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == user_id
-    ).first()
-    
-    if not resume:
+    # Only file_path is needed, so skip loading the whole row
+    file_path = await db.scalar(
+        select(Resume.file_path).where(Resume.id == resume_id, Resume.user_id == user_id)
+    )
+    if file_path is None:
         raise HTTPException(status_code=404, detail="Resume not found")
     
     try:
-        if resume.file_path.startswith("gs://"):
-            client = storage.Client()
-            bucket_name = resume.file_path.split("/")[2]
-            blob_name = "/".join(resume.file_path.split("/")[3:])
+        if file_path.startswith("gs://"):
+            client = await run_in_threadpool(get_storage_client)
+            bucket_name = file_path.split("/")[2]
+            blob_name = "/".join(file_path.split("/")[3:])
             
             bucket = client.bucket(bucket_name)
             blob = bucket.blob(blob_name)
-            if blob.exists():
-                blob.delete()
+            if await run_in_threadpool(blob.exists):
+                await run_in_threadpool(blob.delete)
         else:
-            if os.path.exists(resume.file_path):
-                os.remove(resume.file_path)
+            if os.path.exists(file_path):
+                os.remove(file_path)
         
-        db.delete(resume)
-        db.commit()
+        # Clear dependent matches in one statement rather than loading them through the relationship
+        await db.execute(
+            delete(JobMatch).where(JobMatch.resume_id == resume_id).execution_options(synchronize_session=False)
+        )
+        await db.execute(delete(Resume).where(Resume.id == resume_id).execution_options(synchronize_session=False))
+        await db.commit()
         
         return {"message": "Resume deleted successfully"}
         
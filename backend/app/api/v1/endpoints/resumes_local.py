@@ -1,23 +1,28 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Request
-from sqlalchemy.orm import Session
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload
 from typing import List
 import aiofiles
 import os
-import json
-from app.core.database import get_db
-from app.models.resume import Resume
-from app.schemas.resume import Resume as ResumeSchema, ResumeCreate, ResumeParseResponse
+from app.core.database import get_db, get_or_404
+from app.models.resume import Resume, JobMatch
+from app.schemas.resume import Resume as ResumeSchema, ResumeSummary, ResumeStatus, ResumeCreate, ResumeParseResponse
 from app.services.resume_service import resume_service
+from app.services.metrics_service import track_request_metrics, track_resume_parsing
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+UPLOAD_CHUNK_SIZE = 1 << 20
+
 @router.post("/upload", response_model=ResumeSchema)
+@track_request_metrics
 async def upload_resume(
     request: Request,
     file: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     user_id = getattr(request.state, 'user_id', 'local-user-123')
     
@@ -25,19 +30,19 @@ async def upload_resume(
         raise HTTPException(status_code=400, detail="Only PDF, TXT, and DOCX files are supported")
     
     try:
-        content = await file.read()
-        
         # Store locally for development
         upload_dir = f"/tmp/uploads/{user_id}"
         os.makedirs(upload_dir, exist_ok=True)
         file_path = f"{upload_dir}/{file.filename}"
         
         async with aiofiles.open(file_path, 'wb') as f:
-            await f.write(content)
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await f.write(chunk)
         
         # Extract text content for immediate processing
         if file.filename.lower().endswith('.txt'):
-            content_str = content.decode('utf-8')
+            async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
+                content_str = await f.read()
         else:
             content_str = "Sample resume content for local development"
         
@@ -55,8 +60,8 @@ async def upload_resume(
         )
         
         db.add(db_resume)
-        db.commit()
-        db.refresh(db_resume)
+        await db.commit()
+        await db.refresh(db_resume)
         
         return db_resume
         
@@ -64,55 +69,63 @@ async def upload_resume(
         logger.error(f"Failed to upload resume: {e}")
         raise HTTPException(status_code=500, detail="Failed to upload resume")
 
-@router.get("/", response_model=List[ResumeSchema])
+@router.get("/", response_model=List[ResumeSummary])
+@track_request_metrics
 async def get_resumes(
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     user_id = getattr(request.state, 'user_id', 'local-user-123')
-    resumes = db.query(Resume).filter(Resume.user_id == user_id).all()
+    # Skip content/parsed_data: the list view never shows them and they are the bulk of each row
+    result = await db.execute(select(Resume).options(load_only(
+        Resume.id, Resume.user_id, Resume.filename, Resume.file_path, Resume.status,
+        Resume.created_at, Resume.updated_at
+    ), raiseload("*")).where(Resume.user_id == user_id))
+    resumes = result.scalars().all()
     return resumes
 
 @router.get("/{resume_id}", response_model=ResumeSchema)
+@track_request_metrics
 async def get_resume(
     resume_id: int,
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     user_id = getattr(request.state, 'user_id', 'local-user-123')
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == user_id
-    ).first()
-    
-    if not resume:
-        raise HTTPException(status_code=404, detail="Resume not found")
+    resume = await get_or_404(db, Resume, resume_id, user_id=user_id, detail="Resume not found")
     
     return resume
 
+@router.get("/{resume_id}/status", response_model=ResumeStatus)
+@track_request_metrics
+async def get_resume_status(
+    resume_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_db)
+):
+    user_id = getattr(request.state, 'user_id', 'local-user-123')
+    resume = await get_or_404(db, Resume, resume_id, user_id=user_id, detail="Resume not found")
+    return resume
+
 @router.post("/{resume_id}/parse", response_model=ResumeParseResponse)
+@track_request_metrics
+@track_resume_parsing
 async def parse_resume(
     resume_id: int,
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     user_id = getattr(request.state, 'user_id', 'local-user-123')
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == user_id
-    ).first()
-    
-    if not resume:
-        raise HTTPException(status_code=404, detail="Resume not found")
+    resume = await get_or_404(db, Resume, resume_id, user_id=user_id, detail="Resume not found")
     
     try:
         if not resume.content:
             raise HTTPException(status_code=400, detail="Resume content not available for parsing")
         
-        parsed_data = resume_service.parse_resume_content(resume.content)
+        parsed_data = await resume_service.parse_resume_content_async(resume.content)
         
-        resume.parsed_data = json.dumps(parsed_data)
-        db.commit()
+        resume.parsed_data = parsed_data
+        await db.commit()
         
         return ResumeParseResponse(
             skills=parsed_data.get("skills", []),
@@ -125,26 +138,30 @@ async def parse_resume(
         raise HTTPException(status_code=500, detail="Failed to parse resume")
 
 @router.delete("/{resume_id}")
+@track_request_metrics
 async def delete_resume(
     resume_id: int,
     request: Request,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     user_id = getattr(request.state, 'user_id', 'local-user-123')
-    resume = db.query(Resume).filter(
-        Resume.id == resume_id,
-        Resume.user_id == user_id
-    ).first()
-    
-    if not resume:
+    # Only file_path is needed, so skip loading the whole row
+    file_path = await db.scalar(
+        select(Resume.file_path).where(Resume.id == resume_id, Resume.user_id == user_id)
+    )
+    if file_path is None:
         raise HTTPException(status_code=404, detail="Resume not found")
     
     try:
-        if os.path.exists(resume.file_path):
-            os.remove(resume.file_path)
+        if os.path.exists(file_path):
+            os.remove(file_path)
         
-        db.delete(resume)
-        db.commit()
+        # Clear dependent matches in one statement rather than loading them through the relationship
+        await db.execute(
+            delete(JobMatch).where(JobMatch.resume_id == resume_id).execution_options(synchronize_session=False)
+        )
+        await db.execute(delete(Resume).where(Resume.id == resume_id).execution_options(synchronize_session=False))
+        await db.commit()
         
         return {"message": "Resume deleted successfully"}
         
@@ -1,14 +1,21 @@
 import firebase_admin
 from firebase_admin import credentials, auth
+from cachetools import TTLCache
+from starlette.concurrency import run_in_threadpool
 from app.core.config import settings
 from app.services.secret_service import get_secret
 import json
+import os
+import time
 import logging
 
 logger = logging.getLogger(__name__)
 
 _firebase_app = None
 
+# Raw ID token -> (uid, exp); entries also honour the token's own expiry
+_token_cache = TTLCache(maxsize=10000, ttl=settings.AUTH_TOKEN_CACHE_TTL_SECONDS)
+
 def get_firebase_app():
     global _firebase_app
     if _firebase_app is None:
@@ -25,11 +32,24 @@ def get_firebase_app():
     
     return _firebase_app
 
-async def verify_firebase_token(token: str) -> str:
+# Initialise once at import so the request path only has to verify tokens
+if os.getenv("ENVIRONMENT") == "production":
     try:
         get_firebase_app()
-        decoded_token = auth.verify_id_token(token)
+    except Exception as e:
+        logger.warning(f"Deferred Firebase initialization until first request: {e}")
+
+async def verify_firebase_token(token: str) -> str:
+    cached = _token_cache.get(token)
+    if cached and cached[1] > time.time():
+        return cached[0]
+    
+    try:
+        if _firebase_app is None:
+            get_firebase_app()
+        decoded_token = await run_in_threadpool(auth.verify_id_token, token)
         user_id = decoded_token['uid']
+        _token_cache[token] = (user_id, decoded_token.get('exp', 0))
         return user_id
     except Exception as e:
         logger.error(f"Token verification failed: {e}")
@@ -1,6 +1,7 @@
 from pydantic_settings import BaseSettings
 from typing import List, Optional
 import os
+import tempfile
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "Job Matcher"
@@ -14,6 +15,10 @@ class Settings(BaseSettings):
     DB_USER: Optional[str] = None
     DB_PASSWORD: Optional[str] = None
     DB_NAME: Optional[str] = None
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 3600
     
     # Google Cloud
     PROJECT_ID: Optional[str] = None
@@ -27,6 +32,7 @@ class Settings(BaseSettings):
     FIREBASE_CLIENT_ID: Optional[str] = None
     FIREBASE_AUTH_URI: Optional[str] = None
     FIREBASE_TOKEN_URI: Optional[str] = None
+    AUTH_TOKEN_CACHE_TTL_SECONDS: int = 300
     
     # CORS
     ALLOWED_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:8080"]
@@ -42,6 +48,10 @@ class Settings(BaseSettings):
     # ML Model settings
     MODEL_PATH: str = "/app/models"
     SPACY_MODEL: str = "en_core_web_sm"
+    MATCH_CACHE_TTL_SECONDS: int = 3600
+    JOB_EMBEDDING_DIM: int = 1024
+    NLP_WORKERS: Optional[int] = None
+    EMBEDDING_STORE_PATH: str = os.path.join(tempfile.gettempdir(), "job-matcher", "embeddings.sqlite3")
     
     class Config:
         env_file = ".env"
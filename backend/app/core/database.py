@@ -1,24 +1,112 @@
-from sqlalchemy import create_engine
+from fastapi import HTTPException
+from sqlalchemy import text, select, exists
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from typing import Optional
 from app.core.config import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+def _async_database_url(url: str) -> str:
+    # Plain postgresql:// URLs default to psycopg2; route them through asyncpg instead
+    for prefix in ("postgresql+psycopg2://", "postgresql://", "postgres://"):
+        if url.startswith(prefix):
+            return "postgresql+asyncpg://" + url[len(prefix):]
+    return url
+
 try:
-    DATABASE_URL = settings.get_database_url()
-    engine = create_engine(DATABASE_URL, pool_pre_ping=True)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    DATABASE_URL = _async_database_url(settings.get_database_url())
+    engine = create_async_engine(
+        DATABASE_URL,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True
+    )
+    AsyncSessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
     Base = declarative_base()
     logger.info("Database connection established")
 except Exception as e:
     logger.error(f"Database connection failed: {e}")
     raise
 
-def get_db() -> Session:
-    db = SessionLocal()
-    try:
+def _create_missing_indexes(conn):
+    # create_all skips tables that already exist, so indexes added later need their own pass
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                with conn.begin_nested():
+                    index.create(conn, checkfirst=True)
+            except Exception as e:
+                # One bad index should not block startup; known type changes are handled by _SCHEMA_UPGRADES
+                logger.warning(f"Could not create index {index.name}: {e}")
+
+def _to_jsonb(table: str, column: str) -> str:
+    return f"""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = current_schema() AND table_name = '{table}'
+                  AND column_name = '{column}' AND data_type <> 'jsonb'
+            ) THEN
+                ALTER TABLE {table} ALTER COLUMN {column} TYPE JSONB USING {column}::text::jsonb;
+            END IF;
+        END $$
+    """
+
+# create_all never alters a table that already exists, so columns and types added after a table
+# first shipped are brought up to date here; each statement is idempotent and runs on every startup
+_SCHEMA_UPGRADES = (
+    # JobListing.embedding, read by JobIndex.rebuild at startup
+    "ALTER TABLE job_listings ADD COLUMN IF NOT EXISTS embedding BYTEA",
+    # Resume.status; existing rows were uploaded and parsed synchronously, so they are ready
+    "ALTER TABLE resumes ADD COLUMN IF NOT EXISTS status VARCHAR NOT NULL DEFAULT 'ready'",
+    # Resume.parsed_data (was TEXT holding json.dumps output) and JobMatch.matching_skills (was JSON)
+    # are JSONB; converted only while still on the old type so later startups skip the table rewrite
+    _to_jsonb("resumes", "parsed_data"),
+    _to_jsonb("job_matches", "matching_skills"),
+    # JobMatch (resume_id, match_score DESC) replaces the single-column resume_id index
+    "CREATE INDEX IF NOT EXISTS ix_job_matches_resume_score ON job_matches (resume_id, match_score DESC)",
+    "DROP INDEX IF EXISTS ix_job_matches_resume_id",
+    # JobMatch (job_listing_id, resume_id) is unique; older tables may hold duplicates, so keep the
+    # newest row of each pair before building the index, and only while the index is still missing
+    """
+        DO $$
+        BEGIN
+            IF to_regclass('uq_job_matches_job_resume') IS NULL THEN
+                DELETE FROM job_matches a USING job_matches b
+                WHERE a.job_listing_id = b.job_listing_id AND a.resume_id = b.resume_id AND a.id < b.id;
+                CREATE UNIQUE INDEX uq_job_matches_job_resume ON job_matches (job_listing_id, resume_id);
+            END IF;
+        END $$
+    """,
+)
+
+async def init_db():
+    """Create tables, apply schema upgrades, then indexes; pg_trgm must exist before the trigram indexes are built."""
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.create_all)
+        for statement in _SCHEMA_UPGRADES:
+            await conn.execute(text(statement))
+        await conn.run_sync(_create_missing_indexes)
+
+async def get_db() -> AsyncSession:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
+
+async def get_or_404(db: AsyncSession, model, obj_id: int, *, user_id: Optional[str] = None, detail: str = "Not found"):
+    """Fetch by primary key via the identity map, raising 404 when missing or not owned by user_id."""
+    obj = await db.get(model, obj_id)
+    if obj is None or (user_id is not None and obj.user_id != user_id):
+        raise HTTPException(status_code=404, detail=detail)
+    return obj
+
+async def ensure_owned(db: AsyncSession, model, obj_id: int, user_id: str, *, detail: str = "Not found"):
+    """404 unless a row with obj_id owned by user_id exists; issues SELECT EXISTS without loading the row."""
+    owned = await db.scalar(select(exists().where(model.id == obj_id, model.user_id == user_id)))
+    if not owned:
+        raise HTTPException(status_code=404, detail=detail)
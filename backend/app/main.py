@@ -1,37 +1,53 @@
-from fastapi import FastAPI, HTTPException, Depends, status
+from fastapi import FastAPI, HTTPException, Depends, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from typing import Optional
 import uvicorn
 import logging
+import sys
 from contextlib import asynccontextmanager
 
 import os
 from app.core.config import settings
-from app.core.database import engine, Base
-from app.api.v1.api import api_router
-from app.services.logging_service import setup_logging
+from app.core.database import init_db, AsyncSessionLocal
+from app.services.job_index import job_index
+from app.services.resume_service import shutdown_process_pool, close_http_client
 
-# Use local auth for development
-if os.getenv("ENVIRONMENT") == "development":
-    from app.core.local_auth import verify_firebase_token_local as verify_firebase_token
+# Local development swaps in the disk-backed resume routes, plain logging and mock auth
+LOCAL_DEV = os.getenv("ENVIRONMENT") == "development"
+
+if LOCAL_DEV:
+    from app.api.v1.api_local import api_router
+    from app.services.logging_service_local import setup_logging
 else:
+    from app.api.v1.api import api_router
+    from app.services.logging_service import setup_logging
     from app.core.auth import verify_firebase_token
 
 setup_logging()
 logger = logging.getLogger(__name__)
 
+API_TITLE = "Job Matcher API (Local)" if LOCAL_DEV else "Job Matcher API"
+API_VERSION = "1.0.0-local" if LOCAL_DEV else "1.0.0"
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    logger.info("Starting Job Matcher API")
-    Base.metadata.create_all(bind=engine)
+    logger.info(f"Starting {API_TITLE}")
+    await init_db()
+    async with AsyncSessionLocal() as db:
+        await job_index.rebuild(db)
     yield
-    logger.info("Shutting down Job Matcher API")
+    logger.info(f"Shutting down {API_TITLE}")
+    shutdown_process_pool()
+    await close_http_client()
 
 app = FastAPI(
-    title="Job Matcher API",
+    title=API_TITLE,
     description="Resume parsing and job matching service",
-    version="1.0.0",
-    lifespan=lifespan
+    version=API_VERSION,
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
@@ -42,41 +58,42 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-security = HTTPBearer()
+security = HTTPBearer(auto_error=False)
 
-@app.middleware("http")
-async def auth_middleware(request, call_next):
-    if request.url.path in ["/", "/health", "/docs", "/openapi.json"]:
-        response = await call_next(request)
-        return response
-    
-    try:
-        authorization: HTTPAuthorizationCredentials = await security(request)
-        if authorization:
-            token = authorization.credentials
-            user_id = await verify_firebase_token(token)
-            request.state.user_id = user_id
-    except Exception as e:
-        logger.warning(f"Auth middleware error: {e}")
-        request.state.user_id = None
+async def authenticate(
+    request: Request,
+    authorization: Optional[HTTPAuthorizationCredentials] = Depends(security)
+):
+    # Router dependency rather than middleware, so /, /health and /docs never pay for it
+    if LOCAL_DEV:
+        # Mock authentication for local development
+        request.state.user_id = "local-user-123"
+        return
     
-    response = await call_next(request)
-    return response
+    request.state.user_id = None
+    if authorization:
+        try:
+            request.state.user_id = await verify_firebase_token(authorization.credentials)
+        except Exception as e:
+            logger.warning(f"Authentication failed: {e}")
 
-app.include_router(api_router, prefix=settings.API_V1_STR)
+app.include_router(api_router, prefix=settings.API_V1_STR, dependencies=[Depends(authenticate)])
 
 @app.get("/")
 async def root():
-    return {"message": "Job Matcher API", "version": "1.0.0"}
+    return {"message": API_TITLE, "version": API_VERSION}
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    return {"status": "healthy", "environment": "local" if LOCAL_DEV else "production"}
 
 if __name__ == "__main__":
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.DEBUG
+        reload=settings.DEBUG or LOCAL_DEV,
+        # uvloop/httptools ship with uvicorn[standard] but are not available on Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="h11" if sys.platform == "win32" else "httptools"
     )
\ No newline at end of file
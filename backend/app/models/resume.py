@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Float, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, ForeignKey, LargeBinary, Index, UniqueConstraint, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -6,20 +7,31 @@ from app.core.database import Base
 
 class Resume(Base):
     __tablename__ = "resumes"
+    __table_args__ = (
+        # Containment queries on parsed fields (e.g. skills) become index lookups
+        Index("ix_resumes_parsed_data_gin", "parsed_data", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(String, nullable=False, index=True)
     filename = Column(String, nullable=False)
     file_path = Column(String, nullable=False)
     content = Column(Text)
-    parsed_data = Column(Text)
+    parsed_data = Column(JSONB)
+    status = Column(String, nullable=False, default="ready", server_default="ready")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
-    job_matches = relationship("JobMatch", back_populates="resume")
+    # Never read through the resume; "raise" turns an accidental N+1 into an immediate error
+    job_matches = relationship("JobMatch", back_populates="resume", passive_deletes=True, lazy="raise")
 
 class JobListing(Base):
     __tablename__ = "job_listings"
+    __table_args__ = (
+        # Trigram GIN indexes back the ILIKE '%x%' filters in get_job_listings
+        Index("ix_job_company_trgm", "company", postgresql_using="gin", postgresql_ops={"company": "gin_trgm_ops"}),
+        Index("ix_job_location_trgm", "location", postgresql_using="gin", postgresql_ops={"location": "gin_trgm_ops"}),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
@@ -29,22 +41,30 @@ class JobListing(Base):
     location = Column(String)
     salary_min = Column(Integer)
     salary_max = Column(Integer)
-    job_type = Column(String)
-    remote = Column(String)
+    job_type = Column(String, index=True)
+    remote = Column(String, index=True)
+    embedding = Column(LargeBinary)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
-    job_matches = relationship("JobMatch", back_populates="job_listing")
+    job_matches = relationship("JobMatch", back_populates="job_listing", passive_deletes=True, lazy="raise")
 
 class JobMatch(Base):
     __tablename__ = "job_matches"
+    __table_args__ = (
+        # Serves both "matches for this resume" and "top matches for this resume by score"
+        Index("ix_job_matches_resume_score", "resume_id", text("match_score DESC")),
+        UniqueConstraint("job_listing_id", "resume_id", name="uq_job_matches_job_resume"),
+        Index("ix_job_matches_matching_skills_gin", "matching_skills", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     resume_id = Column(Integer, ForeignKey("resumes.id"), nullable=False)
     job_listing_id = Column(Integer, ForeignKey("job_listings.id"), nullable=False)
     match_score = Column(Float, nullable=False)
-    matching_skills = Column(JSON)
+    matching_skills = Column(JSONB)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    resume = relationship("Resume", back_populates="job_matches")
-    job_listing = relationship("JobListing", back_populates="job_matches")
\ No newline at end of file
+    resume = relationship("Resume", back_populates="job_matches", lazy="raise")
+    # Every match response embeds its listing, so load them all in one IN query
+    job_listing = relationship("JobListing", back_populates="job_matches", lazy="selectin")
\ No newline at end of file
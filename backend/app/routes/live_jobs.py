@@ -1,25 +1,99 @@
 from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi.responses import ORJSONResponse
 import asyncio
 import httpx
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Callable, Tuple
 from datetime import datetime, timedelta
+import functools
 import yaml
 import os
 from .sources import greenhouse, lever, ashby, smartrecruiters, adzuna
-from .util import head_ok, embed_resume, embed_jobs, rank, dedupe_jobs
+from .util import head_ok_many, embed_resume, embed_jobs, rank, dedupe_jobs
+from .mock_jobs import MOCK_JOBS, mock_rank_jobs
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
 
-# Load company configurations
-def load_companies():
-    companies_file = "backend/app/routes/companies.yaml"
-    if os.path.exists(companies_file):
-        with open(companies_file, 'r') as f:
-            return yaml.safe_load(f)
+# Local development serves fixtures instead of calling the ATS APIs
+LOCAL_DEV = os.getenv("ENVIRONMENT") == "development"
+# Live search responses carry hundreds of job dicts; orjson encodes them much faster than stdlib json
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# One pooled client for every ATS call so TCP/TLS connections are reused across requests;
+# HTTP/2 lets concurrent calls to the same host multiplex over a single connection
+_http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=12,
+            follow_redirects=True,
+            # Idle connections to the handful of ATS hosts are kept for 5 minutes, so repeat
+            # fan-outs skip DNS resolution and TCP/TLS setup entirely
+            limits=httpx.Limits(max_keepalive_connections=100, max_connections=200, keepalive_expiry=300)
+        )
+    return _http_client
+
+async def close_http_client():
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+COMPANIES_FILE = os.path.join(os.path.dirname(__file__), "companies.yaml")
+
+_ATS_FETCHERS = {
+    "greenhouse": greenhouse.fetch,
+    "lever": lever.fetch,
+    "ashby": ashby.fetch,
+    "smartrecruiters": smartrecruiters.fetch,
+}
+
+# Load company configurations once per process; libyaml's C loader when available
+@functools.lru_cache(maxsize=1)
+def load_companies() -> Dict:
+    if os.path.exists(COMPANIES_FILE):
+        with open(COMPANIES_FILE, 'r') as f:
+            return yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
     return {}
 
+@functools.lru_cache(maxsize=1)
+def company_fetchers() -> List[Tuple[Callable, str]]:
+    """(fetch function, slug) pairs for every configured company with a supported ATS"""
+    fetchers = []
+    for company, config in load_companies().items():
+        fetch = _ATS_FETCHERS.get(config.get('ats', '').lower())
+        slug = config.get('slug', '')
+        if fetch and slug:
+            fetchers.append((fetch, slug))
+    return fetchers
+
+async def _fetch_and_validate(
+    client: httpx.AsyncClient,
+    task,
+    timeout: int
+) -> Tuple[List[Dict], List[Dict], List[Dict]]:
+    """Run one source fetch, then validate its open jobs' links; returns (all, open, valid)"""
+    # The shared client has a fixed timeout, so bound each source by the per-request one here
+    batch = await asyncio.wait_for(task, timeout=timeout)
+    if not isinstance(batch, list):
+        return [], [], []
+    
+    # Filter for currently open jobs
+    open_jobs = [job for job in batch if job.get("open", True)]
+    validation_results = await head_ok_many(client, [job["apply_url"] for job in open_jobs])
+    
+    # Keep only jobs with valid links
+    valid_jobs = []
+    for job, is_valid in zip(open_jobs, validation_results):
+        if is_valid:
+            valid_jobs.append(job)
+        else:
+            logger.debug(f"Dropping job {job.get('title', 'Unknown')} - invalid link")
+    return batch, open_jobs, valid_jobs
+
 @router.post("/api/v1/jobs/live")
 async def jobs_live(
     resume_text: str, 
@@ -31,63 +105,46 @@ async def jobs_live(
     Fetch live jobs from canonical ATS APIs with real-time link validation.
     Returns fresh, valid job postings ranked by relevance to the resume.
     """
+    if LOCAL_DEV:
+        return await _mock_jobs_live(resume_text, max_jobs)
+    
     start_time = datetime.now()
-    companies = load_companies()
     
     try:
         # Fetch jobs from multiple sources in parallel
-        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-            tasks = []
-            
-            # Add company-specific API calls
-            for company, config in companies.items():
-                ats = config.get('ats', '').lower()
-                slug = config.get('slug', '')
-                
-                if ats == 'greenhouse' and slug:
-                    tasks.append(greenhouse.fetch(client, slug))
-                elif ats == 'lever' and slug:
-                    tasks.append(lever.fetch(client, slug))
-                elif ats == 'ashby' and slug:
-                    tasks.append(ashby.fetch(client, slug))
-                elif ats == 'smartrecruiters' and slug:
-                    tasks.append(smartrecruiters.fetch(client, slug))
-            
-            # Add general job board APIs
-            tasks.extend([
-                adzuna.search(client, location),
-                greenhouse.fetch_public(client),
-                lever.fetch_public(client)
-            ])
-            
-            logger.info(f"Fetching jobs from {len(tasks)} sources...")
-            batches = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Collect valid jobs from all sources
-        all_jobs = []
-        for i, batch in enumerate(batches):
-            if isinstance(batch, list):
-                all_jobs.extend(batch)
-            elif isinstance(batch, Exception):
-                logger.warning(f"Source {i} failed: {batch}")
+        client = get_http_client()
         
-        # Filter for currently open jobs
-        open_jobs = [job for job in all_jobs if job.get("open", True)]
-        logger.info(f"Found {len(open_jobs)} open jobs from {len(all_jobs)} total")
+        # Add company-specific API calls
+        tasks = [fetch(client, slug) for fetch, slug in company_fetchers()]
         
-        # Validate links in parallel
-        async with httpx.AsyncClient(timeout=8, follow_redirects=True) as client:
-            validation_tasks = [head_ok(client, job["apply_url"]) for job in open_jobs]
-            validation_results = await asyncio.gather(*validation_tasks, return_exceptions=True)
+        # Add general job board APIs
+        tasks.extend([
+            adzuna.search(client, location),
+            greenhouse.fetch_public(client),
+            lever.fetch_public(client)
+        ])
         
-        # Keep only jobs with valid links
+        logger.info(f"Fetching jobs from {len(tasks)} sources...")
+        # Each source validates its own links as soon as it returns, so validation
+        # overlaps with slower sources instead of waiting for the whole fan-out
+        results = await asyncio.gather(
+            *(_fetch_and_validate(client, task, timeout) for task in tasks),
+            return_exceptions=True
+        )
+        
+        all_jobs = []
+        open_jobs = []
         valid_jobs = []
-        for job, is_valid in zip(open_jobs, validation_results):
-            if isinstance(is_valid, bool) and is_valid:
-                valid_jobs.append(job)
-            else:
-                logger.debug(f"Dropping job {job.get('title', 'Unknown')} - invalid link")
+        for i, result in enumerate(results):
+            if isinstance(result, Exception):
+                logger.warning(f"Source {i} failed: {result}")
+                continue
+            fetched, opened, validated = result
+            all_jobs.extend(fetched)
+            open_jobs.extend(opened)
+            valid_jobs.extend(validated)
         
+        logger.info(f"Found {len(open_jobs)} open jobs from {len(all_jobs)} total")
         logger.info(f"Validated {len(valid_jobs)} jobs with working links")
         
         # Remove duplicates
@@ -98,9 +155,8 @@ async def jobs_live(
         if resume_text and unique_jobs:
             try:
                 resume_vector = embed_resume(resume_text)
-                jobs_with_vectors = embed_jobs(unique_jobs)
-                ranked_jobs = rank(resume_vector, jobs_with_vectors)
-                final_jobs = ranked_jobs[:max_jobs]
+                job_batch = embed_jobs(unique_jobs)
+                final_jobs = rank(resume_vector, job_batch, top_k=max_jobs)
             except Exception as e:
                 logger.warning(f"Ranking failed, using unranked results: {e}")
                 final_jobs = unique_jobs[:max_jobs]
@@ -136,16 +192,23 @@ async def jobs_live(
 @router.get("/api/v1/jobs/live/health")
 async def live_jobs_health():
     """Health check for live job search service"""
+    if LOCAL_DEV:
+        return {
+            "status": "healthy",
+            "timestamp": datetime.now().isoformat(),
+            "test_source": "mock",
+            "test_result": True
+        }
+    
     try:
         # Test one source to verify connectivity
-        async with httpx.AsyncClient(timeout=5) as client:
-            test_jobs = await adzuna.search(client, "US", limit=1)
-            return {
-                "status": "healthy",
-                "timestamp": datetime.now().isoformat(),
-                "test_source": "adzuna",
-                "test_result": len(test_jobs) >= 0
-            }
+        test_jobs = await asyncio.wait_for(adzuna.search(get_http_client(), "US", limit=1), timeout=5)
+        return {
+            "status": "healthy",
+            "timestamp": datetime.now().isoformat(),
+            "test_source": "adzuna",
+            "test_result": len(test_jobs) >= 0
+        }
     except Exception as e:
         logger.error(f"Health check failed: {e}")
         raise HTTPException(status_code=503, detail=f"Service unhealthy: {str(e)}")
@@ -161,17 +224,21 @@ async def prewarm_jobs(background_tasks: BackgroundTasks):
 
 async def _prewarm_job_vectors():
     """Background task to pre-fetch and cache job vectors"""
+    if LOCAL_DEV:
+        logger.info("Skipping job vector pre-warming in local development")
+        return
+    
     try:
         logger.info("Starting job vector pre-warming...")
         
         # Fetch fresh jobs from all sources
-        async with httpx.AsyncClient(timeout=30) as client:
-            tasks = [
-                adzuna.search(client, "US", limit=100),
-                greenhouse.fetch_public(client, limit=100),
-                lever.fetch_public(client, limit=100)
-            ]
-            batches = await asyncio.gather(*tasks, return_exceptions=True)
+        client = get_http_client()
+        tasks = [
+            adzuna.search(client, "US", limit=100),
+            greenhouse.fetch_public(client, limit=100),
+            lever.fetch_public(client, limit=100)
+        ]
+        batches = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Process and cache vectors
         all_jobs = []
@@ -186,3 +253,46 @@ async def _prewarm_job_vectors():
         
     except Exception as e:
         logger.error(f"Pre-warming failed: {e}")
+
+async def _mock_jobs_live(resume_text: str, max_jobs: int) -> Dict:
+    """
+    Mock live job search for local development.
+    Simulates real-time job fetching with mock data.
+    """
+    start_time = datetime.now()
+    
+    try:
+        # Simulate API delay
+        await asyncio.sleep(1)
+        
+        # Fixtures are always open with valid links
+        all_jobs = [dict(job) for job in MOCK_JOBS]
+        unique_jobs = dedupe_jobs(all_jobs)
+        
+        # Rank jobs by relevance
+        if resume_text and unique_jobs:
+            final_jobs = mock_rank_jobs(resume_text, unique_jobs)[:max_jobs]
+        else:
+            final_jobs = unique_jobs[:max_jobs]
+        
+        duration = (datetime.now() - start_time).total_seconds()
+        logger.info(f"Mock live job search completed in {duration:.2f}s: "
+                   f"{len(final_jobs)} jobs returned")
+        
+        return {
+            "jobs": final_jobs,
+            "metadata": {
+                "total_fetched": len(all_jobs),
+                "open_jobs": len(all_jobs),
+                "valid_links": len(all_jobs),
+                "unique_jobs": len(unique_jobs),
+                "returned": len(final_jobs),
+                "duration_seconds": round(duration, 2),
+                "sources_queried": 3,  # Mock sources
+                "timestamp": datetime.now().isoformat()
+            }
+        }
+        
+    except Exception as e:
+        logger.error(f"Mock live job search failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Job search failed: {str(e)}")
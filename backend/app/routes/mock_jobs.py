@@ -0,0 +1,132 @@
+import functools
+import random
+import re
+from typing import List, Dict
+from datetime import datetime
+
+# Mock job sources for local development
+MOCK_JOBS = [
+    {
+        "id": "google_001",
+        "title": "Senior Software Engineer",
+        "company": "Google",
+        "description": "Join Google's engineering team to build scalable systems. We're looking for engineers with experience in Python, JavaScript, and cloud technologies.",
+        "location": "Mountain View, CA",
+        "apply_url": "https://careers.google.com/jobs/results/123456",
+        "posted_at": datetime.now().isoformat(),
+        "open": True,
+        "source": "greenhouse",
+        "job_id": "001",
+        "department": "Engineering",
+        "job_type": "Full-time",
+        "remote": "Hybrid",
+        "salary_min": 150000,
+        "salary_max": 250000,
+        "skills_required": ["Python", "JavaScript", "React", "Go", "Kubernetes"]
+    },
+    {
+        "id": "microsoft_002",
+        "title": "Full Stack Developer",
+        "company": "Microsoft",
+        "description": "Build next-generation cloud applications using Azure, React, and TypeScript. Experience with cloud services and modern web development required.",
+        "location": "Seattle, WA",
+        "apply_url": "https://careers.microsoft.com/us/en/job/123456",
+        "posted_at": datetime.now().isoformat(),
+        "open": True,
+        "source": "greenhouse",
+        "job_id": "002",
+        "department": "Cloud & AI",
+        "job_type": "Full-time",
+        "remote": "Remote",
+        "salary_min": 120000,
+        "salary_max": 200000,
+        "skills_required": ["Python", "JavaScript", "React", "Azure", "TypeScript"]
+    },
+    {
+        "id": "amazon_003",
+        "title": "Backend Engineer",
+        "company": "Amazon",
+        "description": "Design and implement scalable backend services using AWS, Python, and PostgreSQL. Experience with microservices architecture preferred.",
+        "location": "Seattle, WA",
+        "apply_url": "https://www.amazon.jobs/en/jobs/123456",
+        "posted_at": datetime.now().isoformat(),
+        "open": True,
+        "source": "greenhouse",
+        "job_id": "003",
+        "department": "AWS",
+        "job_type": "Full-time",
+        "remote": "On-site",
+        "salary_min": 130000,
+        "salary_max": 220000,
+        "skills_required": ["Python", "Java", "AWS", "Docker", "PostgreSQL"]
+    },
+    {
+        "id": "uber_004",
+        "title": "Software Engineer - Platform",
+        "company": "Uber",
+        "description": "Build the platform that powers Uber's global operations. Work with Go, Python, and distributed systems.",
+        "location": "San Francisco, CA",
+        "apply_url": "https://www.uber.com/careers/list/123456",
+        "posted_at": datetime.now().isoformat(),
+        "open": True,
+        "source": "lever",
+        "job_id": "004",
+        "department": "Platform",
+        "job_type": "Full-time",
+        "remote": "Hybrid",
+        "salary_min": 140000,
+        "salary_max": 230000,
+        "skills_required": ["Go", "Python", "Distributed Systems", "Kubernetes"]
+    },
+    {
+        "id": "stripe_005",
+        "title": "Full Stack Engineer",
+        "company": "Stripe",
+        "description": "Build the future of online payments. Work with React, TypeScript, and Ruby on Rails.",
+        "location": "San Francisco, CA",
+        "apply_url": "https://stripe.com/jobs/123456",
+        "posted_at": datetime.now().isoformat(),
+        "open": True,
+        "source": "lever",
+        "job_id": "005",
+        "department": "Payments",
+        "job_type": "Full-time",
+        "remote": "Remote",
+        "salary_min": 130000,
+        "salary_max": 210000,
+        "skills_required": ["React", "TypeScript", "Ruby", "PostgreSQL"]
+    }
+]
+
+MOCK_KEYWORDS = ("python", "javascript", "react", "aws", "docker", "postgresql", "fastapi")
+
+# One alternation scans a text for every keyword in a single pass
+_MOCK_KEYWORD_RE = re.compile("|".join(re.escape(keyword) for keyword in MOCK_KEYWORDS))
+
+@functools.lru_cache(maxsize=1024)
+def _mock_job_keywords(title: str, description: str) -> frozenset:
+    # Mock postings are static, so each one is scanned once per process; keying on the
+    # field strings (whose hashes are cached) means hits never build the joined text
+    return frozenset(_MOCK_KEYWORD_RE.findall(f"{title} {description}".lower()))
+
+def mock_rank_jobs(resume_text: str, jobs: List[Dict]) -> List[Dict]:
+    """Mock job ranking based on simple keyword matching."""
+    if not resume_text or not jobs:
+        return jobs
+    
+    # Simple keyword matching
+    resume_lower = resume_text.lower()
+    resume_keywords = set(_MOCK_KEYWORD_RE.findall(resume_lower))
+    
+    for job in jobs:
+        job_keywords = _mock_job_keywords(job.get('title', ''), job.get('description', ''))
+        score = 0.2 * len(resume_keywords & job_keywords)
+        
+        # Add some randomness for variety
+        score += random.uniform(0, 0.3)
+        job["match_score"] = min(score, 1.0)
+        job["matching_skills"] = [skill for skill in job.get("skills_required", []) 
+                                if skill.lower() in resume_lower]
+    
+    # Sort by score
+    return sorted(jobs, key=lambda x: x.get("match_score", 0.0), reverse=True)
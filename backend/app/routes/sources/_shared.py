@@ -0,0 +1,157 @@
+# Normalization helpers shared by every job source adapter
+import asyncio
+import functools
+import httpx
+import orjson
+import logging
+import random
+import re
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+# Checked in priority order; case-insensitive so the input is never lower-cased
+_INTERNSHIP_RE = re.compile(r"\bintern(?:ship)?s?\b", re.IGNORECASE)
+_CONTRACT_RE = re.compile(r"\b(?:contract|freelance)", re.IGNORECASE)
+_PART_TIME_RE = re.compile(r"\bpart[- ]?time\b", re.IGNORECASE)
+_REMOTE_RE = re.compile(r"\b(?:remote|work from home|wfh\b)", re.IGNORECASE)
+_HYBRID_RE = re.compile(r"\b(?:hybrid|flexible)", re.IGNORECASE)
+
+# Boards reuse a handful of title templates, so most calls are a dict hit
+@functools.lru_cache(maxsize=8192)
+def extract_job_type(title: str) -> str:
+    """Extract job type from title"""
+    if _INTERNSHIP_RE.search(title):
+        return "Internship"
+    elif _CONTRACT_RE.search(title):
+        return "Contract"
+    elif _PART_TIME_RE.search(title):
+        return "Part-time"
+    else:
+        return "Full-time"
+
+def extract_remote_status(text: str) -> str:
+    """Extract remote status from text"""
+    if _REMOTE_RE.search(text):
+        return "Remote"
+    elif _HYBRID_RE.search(text):
+        return "Hybrid"
+    else:
+        return "On-site"
+
+def field(*path: Any, default: Any = "") -> Callable[[Dict], Any]:
+    """Build a getter for a nested JSON field once; int keys index into lists"""
+    def get(obj: Any) -> Any:
+        for key in path:
+            try:
+                obj = obj[key]
+            except (KeyError, IndexError, TypeError):
+                return default
+        return default if obj is None else obj
+    return get
+
+def _constant(value: Any) -> Callable[[Dict], Any]:
+    return lambda obj: value
+
+class AtsSpec(NamedTuple):
+    """How one ATS payload maps onto the normalized job dict"""
+    name: str
+    source: str
+    request: Callable[[httpx.AsyncClient, str, int], Awaitable[httpx.Response]]
+    jobs: Callable[[Any], List[Dict]]
+    title: Callable[[Dict], str]
+    description: Callable[[Dict], str]
+    location: Callable[[Dict], str]
+    apply_url: Callable[[Dict], str]
+    posted_at: Callable[[Dict], Any]
+    open: Callable[[Dict], bool]
+    job_id: Callable[[Dict], Any]
+    department: Callable[[Dict], str]
+    # None means the company name is derived from the slug
+    company: Optional[Callable[[Dict], str]] = None
+
+# Requests in flight across every ATS fetch, so a large company list cannot trip rate limits
+_MAX_CONCURRENT_REQUESTS = 16
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_ATTEMPTS = 4
+_MAX_BACKOFF_SECONDS = 8.0
+
+# Created lazily so it binds to the running event loop
+_request_semaphore: Optional[asyncio.Semaphore] = None
+
+def _get_request_semaphore() -> asyncio.Semaphore:
+    global _request_semaphore
+    if _request_semaphore is None:
+        _request_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+    return _request_semaphore
+
+def _retry_delay(response: Optional[httpx.Response], attempt: int) -> float:
+    """Retry-After when the server sent one, otherwise full-jitter exponential backoff."""
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), _MAX_BACKOFF_SECONDS)
+    return random.uniform(0, min(_MAX_BACKOFF_SECONDS, 0.5 * 2 ** attempt))
+
+async def _request_with_retry(spec: AtsSpec, client: httpx.AsyncClient, company_slug: str, limit: int) -> httpx.Response:
+    """Issue spec.request under the shared concurrency cap, retrying throttling, 5xx and transport errors."""
+    for attempt in range(_MAX_ATTEMPTS):
+        response = None
+        try:
+            async with _get_request_semaphore():
+                response = await spec.request(client, company_slug, limit)
+            if response.status_code not in _RETRY_STATUSES:
+                return response
+        except httpx.TransportError:
+            if attempt == _MAX_ATTEMPTS - 1:
+                raise
+        
+        if attempt < _MAX_ATTEMPTS - 1:
+            delay = _retry_delay(response, attempt)
+            logger.debug(f"{spec.name} retry {attempt + 1} for {company_slug} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+    return response
+
+async def fetch_ats(client: httpx.AsyncClient, company_slug: str, limit: int = 50, *, spec: AtsSpec) -> List[Dict]:
+    """
+    Fetch and normalize one company's currently published jobs from the ATS described by spec.
+    Jobs without an apply URL or that are not open are dropped.
+    """
+    try:
+        response = await _request_with_retry(spec, client, company_slug, limit)
+        response.raise_for_status()
+        jobs = spec.jobs(orjson.loads(response.content))
+    except Exception as e:
+        logger.error(f"{spec.name} API error for {company_slug}: {e}")
+        return []
+    
+    default_company = company_slug.title()
+    company = spec.company or _constant(default_company)
+    normalized_jobs = []
+    for job in jobs[:limit]:
+        try:
+            apply_url = spec.apply_url(job)
+            if not apply_url or not spec.open(job):
+                continue
+            
+            title = spec.title(job)
+            description = spec.description(job)
+            normalized_jobs.append({
+                "title": title,
+                "company": company(job) or default_company,
+                "description": description,
+                "location": spec.location(job),
+                "apply_url": apply_url,
+                "posted_at": spec.posted_at(job),
+                "open": True,
+                "source": spec.source,
+                "job_id": spec.job_id(job),
+                "department": spec.department(job),
+                "job_type": extract_job_type(title),
+                "remote": extract_remote_status(title + " " + description)
+            })
+        except Exception as e:
+            logger.warning(f"Failed to normalize {spec.name} job {spec.job_id(job) or 'unknown'}: {e}")
+            continue
+    
+    logger.info(f"Fetched {len(normalized_jobs)} jobs from {spec.name} ({company_slug})")
+    return normalized_jobs
@@ -1,8 +1,13 @@
+import asyncio
 import httpx
+import orjson
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
+from ._shared import extract_job_type, extract_remote_status
+from types import MappingProxyType
 import os
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -10,113 +15,119 @@ logger = logging.getLogger(__name__)
 ADZUNA_APP_ID = os.getenv("ADZUNA_APP_ID", "")
 ADZUNA_API_KEY = os.getenv("ADZUNA_API_KEY", "")
 
+# Map location to Adzuna country codes
+_COUNTRY_MAP = MappingProxyType({
+    "US": "us",
+    "GB": "gb", 
+    "AU": "au",
+    "BR": "br",
+    "CA": "ca",
+    "DE": "de",
+    "FR": "fr",
+    "IN": "in",
+    "IT": "it",
+    "MX": "mx",
+    "NL": "nl",
+    "NZ": "nz",
+    "PL": "pl",
+    "RU": "ru",
+    "SG": "sg",
+    "ES": "es",
+    "SE": "se",
+    "ZA": "za"
+})
+
+_ENABLED = bool(ADZUNA_APP_ID and ADZUNA_API_KEY)
+
+# Request pieces that never change between calls
+_URLS = MappingProxyType({
+    country: httpx.URL(f"https://api.adzuna.com/v1/api/jobs/{country}/search/1")
+    for country in set(_COUNTRY_MAP.values())
+})
+_BASE_PARAMS = MappingProxyType({
+    "app_id": ADZUNA_APP_ID,
+    "app_key": ADZUNA_API_KEY,
+    "what": "software engineer developer python javascript",
+    "content-type": "application/json"
+})
+
+# Short-lived results per (country, limit); bursts of live searches share one upstream call
+_CACHE_TTL_SECONDS = 90
+_ADZUNA_CACHE: Dict[Tuple[str, int], Tuple[float, List[Dict]]] = {}
+_ADZUNA_LOCKS: Dict[Tuple[str, int], asyncio.Lock] = {}
+
 async def search(client: httpx.AsyncClient, location: str = "US", limit: int = 50) -> List[Dict]:
     """
     Search jobs from Adzuna API.
     Returns jobs from today with canonical redirect URLs.
+    Concurrent callers for the same country and limit share one in-flight request.
     """
-    if not ADZUNA_APP_ID or not ADZUNA_API_KEY:
+    if not _ENABLED:
         logger.warning("Adzuna API credentials not configured")
         return []
     
-    try:
-        # Map location to Adzuna country codes
-        country_map = {
-            "US": "us",
-            "GB": "gb", 
-            "AU": "au",
-            "BR": "br",
-            "CA": "ca",
-            "DE": "de",
-            "FR": "fr",
-            "IN": "in",
-            "IT": "it",
-            "MX": "mx",
-            "NL": "nl",
-            "NZ": "nz",
-            "PL": "pl",
-            "RU": "ru",
-            "SG": "sg",
-            "ES": "es",
-            "SE": "se",
-            "ZA": "za"
-        }
-        
-        country = country_map.get(location.upper(), "us")
-        
-        # Search for jobs from today
-        url = f"https://api.adzuna.com/v1/api/jobs/{country}/search/1"
-        params = {
-            "app_id": ADZUNA_APP_ID,
-            "app_key": ADZUNA_API_KEY,
-            "results_per_page": min(limit, 50),
-            "what": "software engineer developer python javascript",
-            "content-type": "application/json"
-        }
-        
-        response = await client.get(url, params=params)
-        response.raise_for_status()
+    country = _COUNTRY_MAP.get(location.upper(), "us")
+    key = (country, limit)
+    
+    hit = _ADZUNA_CACHE.get(key)
+    if hit and time.monotonic() - hit[0] < _CACHE_TTL_SECONDS:
+        return list(hit[1])
+    
+    lock = _ADZUNA_LOCKS.setdefault(key, asyncio.Lock())
+    async with lock:
+        # Another caller may have refreshed the entry while we waited
+        hit = _ADZUNA_CACHE.get(key)
+        if hit and time.monotonic() - hit[0] < _CACHE_TTL_SECONDS:
+            return list(hit[1])
         
-        data = response.json()
-        jobs = data.get("results", [])
+        try:
+            normalized_jobs = await _fetch(client, country, limit)
+        except Exception as e:
+            logger.error(f"Adzuna API error: {e}")
+            return []
         
-        normalized_jobs = []
-        for job in jobs:
-            try:
-                normalized_job = {
-                    "title": job.get("title", ""),
-                    "company": job.get("company", {}).get("display_name", ""),
-                    "description": job.get("description", ""),
-                    "location": job.get("location", {}).get("display_name", ""),
-                    "apply_url": job.get("redirect_url", ""),
-                    "posted_at": job.get("created", ""),
-                    "open": True,  # Adzuna only returns active jobs
-                    "source": "adzuna",
-                    "job_id": job.get("id", ""),
-                    "salary_min": _extract_salary(job.get("salary_min")),
-                    "salary_max": _extract_salary(job.get("salary_max")),
-                    "job_type": _extract_job_type(job.get("title", "")),
-                    "remote": _extract_remote_status(job.get("title", "") + " " + job.get("description", ""))
-                }
+        _ADZUNA_CACHE[key] = (time.monotonic(), normalized_jobs)
+        return list(normalized_jobs)
+
+async def _fetch(client: httpx.AsyncClient, country: str, limit: int) -> List[Dict]:
+    # Search for jobs from today
+    response = await client.get(_URLS[country], params={**_BASE_PARAMS, "results_per_page": min(limit, 50)})
+    response.raise_for_status()
+    
+    data = orjson.loads(response.content)
+    jobs = data.get("results", [])
+    
+    normalized_jobs = []
+    for job in jobs:
+        try:
+            normalized_job = {
+                "title": job.get("title", ""),
+                "company": job.get("company", {}).get("display_name", ""),
+                "description": job.get("description", ""),
+                "location": job.get("location", {}).get("display_name", ""),
+                "apply_url": job.get("redirect_url", ""),
+                "posted_at": job.get("created", ""),
+                "open": True,  # Adzuna only returns active jobs
+                "source": "adzuna",
+                "job_id": job.get("id", ""),
+                "salary_min": _extract_salary(job.get("salary_min")),
+                "salary_max": _extract_salary(job.get("salary_max")),
+                "job_type": extract_job_type(job.get("title", "")),
+                "remote": extract_remote_status(job.get("title", "") + " " + job.get("description", ""))
+            }
+            
+            if normalized_job["apply_url"]:
+                normalized_jobs.append(normalized_job)
                 
-                if normalized_job["apply_url"]:
-                    normalized_jobs.append(normalized_job)
-                    
-            except Exception as e:
-                logger.warning(f"Failed to normalize Adzuna job {job.get('id', 'unknown')}: {e}")
-                continue
-        
-        logger.info(f"Fetched {len(normalized_jobs)} jobs from Adzuna ({country})")
-        return normalized_jobs
-        
-    except Exception as e:
-        logger.error(f"Adzuna API error: {e}")
-        return []
+        except Exception as e:
+            logger.warning(f"Failed to normalize Adzuna job {job.get('id', 'unknown')}: {e}")
+            continue
+    
+    logger.info(f"Fetched {len(normalized_jobs)} jobs from Adzuna ({country})")
+    return normalized_jobs
 
 def _extract_salary(salary_value) -> Optional[int]:
     """Extract salary value"""
     if salary_value and isinstance(salary_value, (int, float)):
         return int(salary_value)
     return None
-
-def _extract_job_type(title: str) -> str:
-    """Extract job type from title"""
-    title_lower = title.lower()
-    if any(word in title_lower for word in ["intern", "internship"]):
-        return "Internship"
-    elif any(word in title_lower for word in ["contract", "freelance"]):
-        return "Contract"
-    elif any(word in title_lower for word in ["part-time", "parttime"]):
-        return "Part-time"
-    else:
-        return "Full-time"
-
-def _extract_remote_status(text: str) -> str:
-    """Extract remote status from text"""
-    text_lower = text.lower()
-    if any(word in text_lower for word in ["remote", "work from home", "wfh"]):
-        return "Remote"
-    elif any(word in text_lower for word in ["hybrid", "flexible"]):
-        return "Hybrid"
-    else:
-        return "On-site"
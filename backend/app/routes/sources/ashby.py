@@ -1,103 +1,50 @@
 import httpx
-import logging
-from typing import List, Dict, Optional
-from datetime import datetime
+from functools import partial
+from ._shared import AtsSpec, fetch_ats, field
 
-logger = logging.getLogger(__name__)
-
-async def fetch(client: httpx.AsyncClient, company_slug: str, limit: int = 50) -> List[Dict]:
-    """
-    Fetch jobs from Ashby API for a specific company.
-    Uses the public job postings API which returns currently published jobs.
-    """
-    try:
-        url = f"https://jobs.ashbyhq.com/api/non-user-graphql"
-        query = """
-        query JobBoardQuery($organizationHostname: String!, $after: String, $limit: Int!) {
-          jobBoard(organizationHostname: $organizationHostname) {
-            jobs(after: $after, first: $limit) {
-              edges {
-                node {
-                  id
-                  title
-                  locationName
-                  teamName
-                  applyUrl
-                  description
-                  publishedAt
-                  isActive
-                }
-              }
-            }
-          }
-        }
-        """
-        
-        variables = {
-            "organizationHostname": company_slug,
-            "limit": limit
+_JOB_BOARD_QUERY = """
+query JobBoardQuery($organizationHostname: String!, $after: String, $limit: Int!) {
+  jobBoard(organizationHostname: $organizationHostname) {
+    jobs(after: $after, first: $limit) {
+      edges {
+        node {
+          id
+          title
+          locationName
+          teamName
+          applyUrl
+          description
+          publishedAt
+          isActive
         }
-        
-        response = await client.post(url, json={
-            "query": query,
-            "variables": variables
-        })
-        response.raise_for_status()
-        
-        data = response.json()
-        jobs_data = data.get("data", {}).get("jobBoard", {}).get("jobs", {}).get("edges", [])
-        
-        normalized_jobs = []
-        for job_edge in jobs_data:
-            try:
-                job = job_edge.get("node", {})
-                normalized_job = {
-                    "title": job.get("title", ""),
-                    "company": company_slug.title(),
-                    "description": job.get("description", ""),
-                    "location": job.get("locationName", ""),
-                    "apply_url": job.get("applyUrl", ""),
-                    "posted_at": job.get("publishedAt", ""),
-                    "open": job.get("isActive", False),
-                    "source": "ashby",
-                    "job_id": job.get("id", ""),
-                    "department": job.get("teamName", ""),
-                    "job_type": _extract_job_type(job.get("title", "")),
-                    "remote": _extract_remote_status(job.get("title", "") + " " + job.get("description", ""))
-                }
-                
-                if normalized_job["apply_url"] and normalized_job["open"]:
-                    normalized_jobs.append(normalized_job)
-                    
-            except Exception as e:
-                logger.warning(f"Failed to normalize Ashby job {job.get('id', 'unknown')}: {e}")
-                continue
-        
-        logger.info(f"Fetched {len(normalized_jobs)} jobs from Ashby ({company_slug})")
-        return normalized_jobs
-        
-    except Exception as e:
-        logger.error(f"Ashby API error for {company_slug}: {e}")
-        return []
+      }
+    }
+  }
+}
+"""
+
+def _request(client: httpx.AsyncClient, company_slug: str, limit: int):
+    return client.post("https://jobs.ashbyhq.com/api/non-user-graphql", json={
+        "query": _JOB_BOARD_QUERY,
+        "variables": {"organizationHostname": company_slug, "limit": limit}
+    })
+
+_edges = field("data", "jobBoard", "jobs", "edges", default=[])
 
-def _extract_job_type(title: str) -> str:
-    """Extract job type from title"""
-    title_lower = title.lower()
-    if any(word in title_lower for word in ["intern", "internship"]):
-        return "Internship"
-    elif any(word in title_lower for word in ["contract", "freelance"]):
-        return "Contract"
-    elif any(word in title_lower for word in ["part-time", "parttime"]):
-        return "Part-time"
-    else:
-        return "Full-time"
+ASHBY_SPEC = AtsSpec(
+    name="Ashby",
+    source="ashby",
+    request=_request,
+    jobs=lambda payload: [edge.get("node") or {} for edge in _edges(payload)],
+    title=field("title"),
+    description=field("description"),
+    location=field("locationName"),
+    apply_url=field("applyUrl"),
+    posted_at=field("publishedAt"),
+    open=field("isActive", default=False),
+    job_id=field("id"),
+    department=field("teamName")
+)
 
-def _extract_remote_status(text: str) -> str:
-    """Extract remote status from text"""
-    text_lower = text.lower()
-    if any(word in text_lower for word in ["remote", "work from home", "wfh"]):
-        return "Remote"
-    elif any(word in text_lower for word in ["hybrid", "flexible"]):
-        return "Hybrid"
-    else:
-        return "On-site"
+# Fetch jobs from Ashby for a specific company
+fetch = partial(fetch_ats, spec=ASHBY_SPEC)
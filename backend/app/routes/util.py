@@ -1,11 +1,18 @@
+import asyncio
 import httpx
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Hashable, Optional, Tuple
 import hashlib
 from datetime import datetime
 import numpy as np
 from google.cloud import aiplatform
+import math
 import os
+import threading
+from urllib.parse import urlparse
+from cachetools import TTLCache, LRUCache
+from app.util.keywords import KeywordMatcher
+from .vector_store import get_embedding_store
 
 logger = logging.getLogger(__name__)
 
@@ -15,14 +22,75 @@ try:
 except Exception as e:
     logger.warning(f"Vertex AI initialization failed: {e}")
 
+EMBEDDING_MODEL_NAME = "textembedding-gecko@001"
+
+# Loaded once per process; from_pretrained does a metadata round trip to Vertex AI
+_embedding_model = None
+_embedding_model_lock = threading.Lock()
+
+def get_embedding_model():
+    global _embedding_model
+    if _embedding_model is None:
+        with _embedding_model_lock:
+            if _embedding_model is None:
+                _embedding_model = aiplatform.TextEmbeddingModel.from_pretrained(EMBEDDING_MODEL_NAME)
+    return _embedding_model
+
+# ATS-hosted apply pages come straight from the ATS listing APIs, so they are live by construction
+TRUSTED_HOSTS = {
+    "boards.greenhouse.io",
+    "job-boards.greenhouse.io",
+    "jobs.lever.co",
+    "jobs.ashbyhq.com",
+    "jobs.smartrecruiters.com",
+    "api.smartrecruiters.com",
+    "www.adzuna.com",
+}
+
+# Recent validation results by URL, shared across requests
+_HEAD_CACHE: TTLCache = TTLCache(maxsize=50_000, ttl=600)
+
+# Created lazily so it binds to the running event loop
+_head_semaphore: Optional[asyncio.Semaphore] = None
+
+def _get_head_semaphore() -> asyncio.Semaphore:
+    global _head_semaphore
+    if _head_semaphore is None:
+        _head_semaphore = asyncio.Semaphore(50)
+    return _head_semaphore
+
 async def head_ok(client: httpx.AsyncClient, url: str) -> bool:
     """
     Validate that a job application URL is accessible.
-    HEAD request with fallback to GET, follows redirects.
+    Trusted ATS hosts skip the network check; other results are cached for 10 minutes.
     """
     if not url:
         return False
     
+    if urlparse(url).netloc.lower() in TRUSTED_HOSTS:
+        return True
+    
+    cached = _HEAD_CACHE.get(url)
+    if cached is not None:
+        return cached
+    
+    async with _get_head_semaphore():
+        result = await _check_url(client, url)
+    # Transport failures are usually transient, so only definite answers are cached
+    if result is not None:
+        _HEAD_CACHE[url] = result
+    return bool(result)
+
+async def head_ok_many(client: httpx.AsyncClient, urls: List[str]) -> List[bool]:
+    """Validate a batch of URLs concurrently on one client; results follow the input order."""
+    results = await asyncio.gather(*(head_ok(client, url) for url in urls), return_exceptions=True)
+    return [result is True for result in results]
+
+async def _check_url(client: httpx.AsyncClient, url: str) -> Optional[bool]:
+    """
+    HEAD request with fallback to GET, follows redirects.
+    Returns None when the check itself failed (timeout, connection error).
+    """
     try:
         # Try HEAD first
         response = await client.head(url, timeout=5)
@@ -38,13 +106,13 @@ async def head_ok(client: httpx.AsyncClient, url: str) -> bool:
         
     except httpx.TimeoutException:
         logger.debug(f"Timeout validating URL: {url}")
-        return False
+        return None
     except httpx.HTTPStatusError as e:
         logger.debug(f"HTTP error validating URL {url}: {e.response.status_code}")
         return False
     except Exception as e:
         logger.debug(f"Error validating URL {url}: {e}")
-        return False
+        return None
 
 def dedupe_jobs(jobs: List[Dict]) -> List[Dict]:
     """
@@ -55,9 +123,7 @@ def dedupe_jobs(jobs: List[Dict]) -> List[Dict]:
     
     for job in jobs:
         # Create a unique key for each job
-        key = hashlib.md5(
-            f"{job.get('title', '')}{job.get('company', '')}{job.get('location', '')}".encode()
-        ).hexdigest()
+        key = (job.get('title', ''), job.get('company', ''), job.get('location', ''))
         
         if key not in seen:
             seen.add(key)
@@ -65,19 +131,38 @@ def dedupe_jobs(jobs: List[Dict]) -> List[Dict]:
     
     return unique_jobs
 
+# Resume vectors by content hash; users re-run searches with the same resume
+_RESUME_EMBEDDING_CACHE: LRUCache = LRUCache(maxsize=2048)
+
+# Job vectors by stable job key, stored as (int8 vector, scale) to quarter memory and bandwidth
+# in ranking; postings change slowly so a day-long TTL keeps prewarmed vectors useful
+_JOB_VECTOR_CACHE: TTLCache = TTLCache(maxsize=100_000, ttl=24 * 3600)
+
+# Job vectors by hash of the embedded text, so reposts under a new key are not re-embedded
+_JOB_TEXT_VECTOR_CACHE: LRUCache = LRUCache(maxsize=100_000)
+
+# Texts per get_embeddings request, the Vertex AI per-call instance limit
+_EMBED_BATCH_SIZE = 250
+
 def embed_resume(resume_text: str) -> Optional[List[float]]:
     """
     Generate embeddings for resume text using Vertex AI.
+    Results are cached by a hash of the text.
     """
     try:
         if not resume_text:
             return None
+        
+        key = hashlib.blake2b(resume_text.encode(), digest_size=16).hexdigest()
+        cached = _RESUME_EMBEDDING_CACHE.get(key)
+        if cached is not None:
+            return cached
             
         # Use Vertex AI Text Embeddings API
-        model = aiplatform.TextEmbeddingModel.from_pretrained("textembedding-gecko@001")
-        embeddings = model.get_embeddings([resume_text])
+        embeddings = get_embedding_model().get_embeddings([resume_text])
         
         if embeddings and len(embeddings) > 0:
+            _RESUME_EMBEDDING_CACHE[key] = embeddings[0].values
             return embeddings[0].values
         return None
         
@@ -85,128 +170,201 @@ def embed_resume(resume_text: str) -> Optional[List[float]]:
         logger.warning(f"Failed to embed resume: {e}")
         return None
 
-def embed_jobs(jobs: List[Dict], cache: bool = False) -> List[Dict]:
+class JobBatch:
     """
-    Generate embeddings for job descriptions and add to job objects.
-    Optionally cache vectors in database.
+    Columnar view of a batch of jobs: one (N, d) int8 vector matrix with per-row scales,
+    a mask of rows that were actually embedded, plus metadata dicts in row order.
     """
-    try:
-        model = aiplatform.TextEmbeddingModel.from_pretrained("textembedding-gecko@001")
-        
-        # Prepare texts for embedding
-        texts = []
-        for job in jobs:
-            text = f"{job.get('title', '')} {job.get('description', '')}"
-            texts.append(text)
-        
-        # Get embeddings in batch
-        embeddings = model.get_embeddings(texts)
+    def __init__(self, vectors: np.ndarray, scales: np.ndarray, meta: List[Dict]):
+        self.vectors = vectors
+        self.scales = scales
+        self.embedded = scales > 0
+        self.meta = meta
+
+    def __len__(self) -> int:
+        return len(self.meta)
+
+def embed_jobs(jobs: List[Dict], cache: bool = True) -> JobBatch:
+    """
+    Generate embeddings for job descriptions as a single int8 matrix aligned with jobs.
+    Vectors already cached by job or by text, in memory or in the on-disk embedding store,
+    are reused; only distinct unseen texts hit Vertex AI, in batches of _EMBED_BATCH_SIZE.
+    Rows for jobs that could not be embedded are left as zeros.
+    """
+    rows: List[Optional[Tuple[np.ndarray, float]]] = [_JOB_VECTOR_CACHE.get(_job_key(job)) for job in jobs]
+    
+    # The same posting often appears on several boards under different keys, so group misses
+    # by text: each distinct text is looked up once and embedded at most once
+    pending: Dict[bytes, List[int]] = {}
+    texts: Dict[bytes, str] = {}
+    for i, row in enumerate(rows):
+        if row is not None:
+            continue
+        text = f"{jobs[i].get('title', '')} {jobs[i].get('description', '')}"
+        digest = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        row = _JOB_TEXT_VECTOR_CACHE.get(digest)
+        if row is not None:
+            rows[i] = row
+            continue
+        pending.setdefault(digest, []).append(i)
+        texts[digest] = text
+    
+    # Content-addressed vectors persisted by any earlier request or worker
+    store = get_embedding_store() if cache and pending else None
+    if store is not None:
+        try:
+            stored = store.get_many(EMBEDDING_MODEL_NAME, list(pending))
+        except Exception as e:
+            logger.warning(f"Embedding store lookup failed: {e}")
+            stored = {}
+        for digest, row in stored.items():
+            _JOB_TEXT_VECTOR_CACHE[digest] = row
+            for i in pending.pop(digest):
+                rows[i] = row
+                _cache_job_vector(jobs[i], row)
+    
+    digests = list(pending)
+    embedded = 0
+    for start in range(0, len(digests), _EMBED_BATCH_SIZE):
+        chunk = digests[start:start + _EMBED_BATCH_SIZE]
+        try:
+            embeddings = get_embedding_model().get_embeddings([texts[digest] for digest in chunk])
+        except Exception as e:
+            logger.warning(f"Failed to embed {len(chunk)} jobs: {e}")
+            continue
         
-        # Add embeddings to jobs
-        for i, job in enumerate(jobs):
-            if i < len(embeddings):
-                job["embedding"] = embeddings[i].values
-                
-                # Cache in database if requested
+        fresh = []
+        for digest, embedding in zip(chunk, embeddings):
+            row = _quantize_unit(np.asarray(embedding.values, dtype=np.float32))
+            embedded += 1
+            fresh.append((digest, row))
+            if cache:
+                _JOB_TEXT_VECTOR_CACHE[digest] = row
+            for i in pending[digest]:
+                rows[i] = row
                 if cache:
-                    _cache_job_vector(job)
-        
-        return jobs
+                    _cache_job_vector(jobs[i], row)
         
-    except Exception as e:
-        logger.warning(f"Failed to embed jobs: {e}")
-        return jobs
+        if store is not None:
+            try:
+                store.put_many(EMBEDDING_MODEL_NAME, fresh)
+            except Exception as e:
+                logger.warning(f"Failed to persist {len(fresh)} job embeddings: {e}")
+    
+    logger.debug(f"Embedded {embedded} distinct job texts for {len(jobs)} jobs")
+    
+    dim = next((len(row[0]) for row in rows if row is not None), 0)
+    vectors = np.zeros((len(jobs), dim), dtype=np.int8)
+    scales = np.zeros(len(jobs), dtype=np.float32)
+    for i, row in enumerate(rows):
+        if row is not None:
+            vectors[i], scales[i] = row
+    return JobBatch(vectors, scales, jobs)
 
-def rank(resume_vector: List[float], jobs: List[Dict]) -> List[Dict]:
+def rank(resume_vector: List[float], batch: JobBatch, top_k: Optional[int] = None) -> List[Dict]:
     """
     Rank jobs by cosine similarity to resume vector.
+    embed_jobs stores each row's scale so the dequantized row is unit length, so scoring
+    is one matrix-vector product and a per-row multiply, with no norms at query time.
     """
-    if not resume_vector or not jobs:
-        return jobs
+    if not len(batch):
+        return []
+    if not resume_vector or batch.vectors.shape[1] == 0:
+        return batch.meta[:top_k] if top_k else batch.meta
     
     try:
-        # Calculate cosine similarities
-        for job in jobs:
-            if "embedding" in job and job["embedding"]:
-                similarity = cosine_similarity(resume_vector, job["embedding"])
-                job["similarity_score"] = similarity
-            else:
-                job["similarity_score"] = 0.0
+        query = _normalize(np.asarray(resume_vector, dtype=np.float32))
+        scores = (batch.vectors.astype(np.float32) @ query) * batch.scales
+        
+        # Jobs that failed to embed score 0, which would beat real negative similarities
+        order = np.where(batch.embedded, scores, -np.inf)
         
-        # Sort by similarity score (descending)
-        ranked_jobs = sorted(jobs, key=lambda x: x.get("similarity_score", 0.0), reverse=True)
+        # Partial selection of the top K avoids sorting every job
+        k = min(top_k or len(scores), len(scores))
+        top = np.argpartition(-order, k - 1)[:k]
+        top = top[np.argsort(-order[top], kind="stable")]
         
-        return ranked_jobs
+        return [{**batch.meta[i], "similarity_score": float(scores[i])} for i in top]
         
     except Exception as e:
         logger.warning(f"Failed to rank jobs: {e}")
-        return jobs
+        return batch.meta[:top_k] if top_k else batch.meta
+
+def _normalize(vector: np.ndarray) -> np.ndarray:
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+def _quantize(vector: np.ndarray) -> Tuple[np.ndarray, float]:
+    """Symmetric int8 quantization; vector is approximately values * scale."""
+    peak = float(np.abs(vector).max()) if vector.size else 0.0
+    if not peak:
+        return np.zeros(vector.shape, dtype=np.int8), 0.0
+    scale = peak / 127.0
+    return np.round(vector / scale).astype(np.int8), scale
+
+def _quantize_unit(vector: np.ndarray) -> Tuple[np.ndarray, float]:
+    """
+    int8 codes plus the scale that makes the dequantized vector exactly unit length.
+    The norm is paid once here, so ranking needs no per-row normalization.
+    """
+    values, _ = _quantize(vector)
+    norm = float(np.linalg.norm(values.astype(np.float32)))
+    return values, (1.0 / norm if norm else 0.0)
 
 def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
     """
     Calculate cosine similarity between two vectors.
     """
     try:
-        vec1 = np.array(vec1)
-        vec2 = np.array(vec2)
-        
-        dot_product = np.dot(vec1, vec2)
-        norm1 = np.linalg.norm(vec1)
-        norm2 = np.linalg.norm(vec2)
+        vec1 = np.asarray(vec1, dtype=np.float32)
+        vec2 = np.asarray(vec2, dtype=np.float32)
         
-        if norm1 == 0 or norm2 == 0:
+        # Three BLAS dots and one sqrt; no linalg.norm dispatch or float64 copies
+        norms = float(np.dot(vec1, vec1)) * float(np.dot(vec2, vec2))
+        if norms == 0:
             return 0.0
             
-        return dot_product / (norm1 * norm2)
+        return float(np.dot(vec1, vec2)) / math.sqrt(norms)
         
     except Exception as e:
         logger.warning(f"Failed to calculate cosine similarity: {e}")
         return 0.0
 
-def _cache_job_vector(job: Dict):
+def _job_key(job: Dict) -> Hashable:
     """
-    Cache job vector in database for reuse.
-    This would integrate with your database schema.
+    Stable cache key for a job: ATS id when present, otherwise a digest of its content fields.
+    """
+    if job.get("job_id"):
+        return (job.get('source', ''), job['job_id'])
+    # Digest rather than the raw fields so 100k cached keys do not pin every full description in memory
+    content = "\x1f".join((job.get('title') or '', job.get('company') or '', job.get('description') or ''))
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
+
+def _cache_job_vector(job: Dict, vector: Tuple[np.ndarray, float]):
+    """
+    Cache job vector for reuse across requests.
     """
     try:
-        # This is a placeholder - implement based on your database setup
-        # Example with SQLAlchemy:
-        # job_vector = JobVector(
-        #     job_id=job.get("job_id"),
-        #     company=job.get("company"),
-        #     title=job.get("title"),
-        #     embedding=job.get("embedding"),
-        #     created_at=datetime.now()
-        # )
-        # db.add(job_vector)
-        # db.commit()
-        pass
+        _JOB_VECTOR_CACHE[_job_key(job)] = vector
         
     except Exception as e:
         logger.warning(f"Failed to cache job vector: {e}")
 
+# Common tech skills
+_TECH_SKILLS = KeywordMatcher([
+    "python", "javascript", "java", "c++", "c#", "go", "rust", "php", "ruby", "swift",
+    "react", "angular", "vue", "node.js", "express", "django", "flask", "fastapi",
+    "aws", "azure", "gcp", "docker", "kubernetes", "terraform", "ansible",
+    "postgresql", "mysql", "mongodb", "redis", "elasticsearch",
+    "git", "jenkins", "github", "gitlab", "bitbucket",
+    "html", "css", "sass", "less", "typescript", "webpack", "babel",
+    "machine learning", "ai", "tensorflow", "pytorch", "scikit-learn",
+    "data science", "pandas", "numpy", "matplotlib", "seaborn"
+])
+
 def extract_skills_from_text(text: str) -> List[str]:
     """
     Extract skills from text using simple keyword matching.
     In production, use NLP libraries or AI services.
     """
-    # Common tech skills
-    skills = [
-        "python", "javascript", "java", "c++", "c#", "go", "rust", "php", "ruby", "swift",
-        "react", "angular", "vue", "node.js", "express", "django", "flask", "fastapi",
-        "aws", "azure", "gcp", "docker", "kubernetes", "terraform", "ansible",
-        "postgresql", "mysql", "mongodb", "redis", "elasticsearch",
-        "git", "jenkins", "github", "gitlab", "bitbucket",
-        "html", "css", "sass", "less", "typescript", "webpack", "babel",
-        "machine learning", "ai", "tensorflow", "pytorch", "scikit-learn",
-        "data science", "pandas", "numpy", "matplotlib", "seaborn"
-    ]
-    
-    text_lower = text.lower()
-    found_skills = []
-    
-    for skill in skills:
-        if skill in text_lower:
-            found_skills.append(skill.title())
-    
-    return list(set(found_skills))  # Remove duplicates
+    return [skill.title() for skill in _TECH_SKILLS.find(text)]
@@ -0,0 +1,71 @@
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+import numpy as np
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Content-addressed, so one file can be shared by every worker on a host and survives restarts
+EMBEDDING_STORE_PATH = settings.EMBEDDING_STORE_PATH
+
+# SQLite caps bound parameters per statement; stay well under the oldest default of 999
+_LOOKUP_CHUNK = 500
+
+class EmbeddingStore:
+    """
+    On-disk map of (model, text digest) to an int8-quantized vector and its scale.
+    """
+    def __init__(self, path: str):
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        # WAL lets readers in other processes proceed while one worker writes
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model TEXT NOT NULL, digest BLOB NOT NULL, vector BLOB NOT NULL, scale REAL NOT NULL, "
+            "PRIMARY KEY (model, digest)) WITHOUT ROWID"
+        )
+
+    def get_many(self, model: str, digests: List[bytes]) -> Dict[bytes, Tuple[np.ndarray, float]]:
+        found: Dict[bytes, Tuple[np.ndarray, float]] = {}
+        with self._lock:
+            for start in range(0, len(digests), _LOOKUP_CHUNK):
+                chunk = digests[start:start + _LOOKUP_CHUNK]
+                rows = self._conn.execute(
+                    f"SELECT digest, vector, scale FROM embeddings WHERE model = ? "
+                    f"AND digest IN ({','.join('?' * len(chunk))})",
+                    [model, *chunk]
+                ).fetchall()
+                for digest, vector, scale in rows:
+                    found[digest] = (np.frombuffer(vector, dtype=np.int8), scale)
+        return found
+
+    def put_many(self, model: str, items: Iterable[Tuple[bytes, Tuple[np.ndarray, float]]]):
+        rows = [(model, digest, vector.tobytes(), float(scale)) for digest, (vector, scale) in items]
+        if not rows:
+            return
+        with self._lock:
+            with self._conn:
+                self._conn.executemany("INSERT OR REPLACE INTO embeddings VALUES (?, ?, ?, ?)", rows)
+
+_store: Optional[EmbeddingStore] = None
+_store_failed = False
+_store_lock = threading.Lock()
+
+def get_embedding_store() -> Optional[EmbeddingStore]:
+    """Open the store on first use; None (and in-memory caching only) if it cannot be opened."""
+    global _store, _store_failed
+    if _store is None and not _store_failed:
+        with _store_lock:
+            if _store is None and not _store_failed:
+                try:
+                    os.makedirs(os.path.dirname(EMBEDDING_STORE_PATH) or ".", exist_ok=True)
+                    _store = EmbeddingStore(EMBEDDING_STORE_PATH)
+                except (OSError, sqlite3.Error) as e:
+                    _store_failed = True
+                    logger.warning(f"Embedding store unavailable at {EMBEDDING_STORE_PATH}: {e}")
+    return _store
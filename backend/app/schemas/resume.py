@@ -18,12 +18,32 @@ class Resume(ResumeBase):
     id: int
     user_id: str
     file_path: str
+    status: str = "ready"
     created_at: datetime
     updated_at: Optional[datetime] = None
 
     class Config:
         from_attributes = True
 
+class ResumeSummary(BaseModel):
+    id: int
+    user_id: str
+    filename: str
+    file_path: str
+    status: str = "ready"
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class ResumeStatus(BaseModel):
+    id: int
+    status: str
+
+    class Config:
+        from_attributes = True
+
 class JobListingBase(BaseModel):
     title: str
     company: str
@@ -0,0 +1,118 @@
+from typing import List, Tuple, Iterable, Optional
+import asyncio
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+from sqlalchemy import select, update, bindparam
+from sqlalchemy.ext.asyncio import AsyncSession
+import logging
+from app.core.config import settings
+from app.models.resume import JobListing
+from app.services.match_cache import fetch_jobs_version
+
+logger = logging.getLogger(__name__)
+
+class JobIndex:
+    """Process-wide inner-product index over precomputed job listing embeddings."""
+
+    def __init__(self, dim: int = 1024):
+        self.dim = dim
+        # Stateless vectorizer: no fit step, so vectors stay comparable across processes and restarts
+        self.vectorizer = HashingVectorizer(
+            n_features=dim,
+            stop_words='english',
+            ngram_range=(1, 2),
+            alternate_sign=False,
+            norm='l2'
+        )
+        self._ids = np.empty(0, dtype=np.int64)
+        self._vectors = np.empty((0, dim), dtype=np.float32)
+        # jobs_version the index was last rebuilt from; upsert/remove only reach the worker that served the write
+        self.version: Optional[str] = None
+        self._rebuild_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def embed(self, text: str) -> np.ndarray:
+        return self.vectorizer.transform([text or ""]).toarray()[0].astype(np.float32)
+
+    def embed_job(self, job: JobListing) -> np.ndarray:
+        return self.embed(" ".join([job.title or "", job.description or "", job.requirements or ""]))
+
+    def to_bytes(self, vector: np.ndarray) -> bytes:
+        return vector.astype(np.float32).tobytes()
+
+    def from_bytes(self, data: bytes) -> np.ndarray:
+        return np.frombuffer(data, dtype=np.float32)
+
+    def load(self, items: Iterable[Tuple[int, np.ndarray]]):
+        items = list(items)
+        if not items:
+            self._ids = np.empty(0, dtype=np.int64)
+            self._vectors = np.empty((0, self.dim), dtype=np.float32)
+            return
+        self._ids = np.array([job_id for job_id, _ in items], dtype=np.int64)
+        self._vectors = np.vstack([vector for _, vector in items]).astype(np.float32)
+
+    def upsert(self, job_id: int, vector: np.ndarray):
+        self.remove(job_id)
+        self._ids = np.append(self._ids, np.int64(job_id))
+        self._vectors = np.vstack([self._vectors, vector.astype(np.float32)[None, :]])
+
+    def remove(self, job_id: int):
+        keep = self._ids != job_id
+        if not keep.all():
+            self._ids = self._ids[keep]
+            self._vectors = self._vectors[keep]
+
+    def search(self, vector: np.ndarray, k: int) -> List[Tuple[int, float]]:
+        """Return up to k (job_id, score) pairs ordered by descending inner product."""
+        if not len(self._ids) or k <= 0:
+            return []
+
+        scores = self._vectors @ vector.astype(np.float32)
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(int(self._ids[i]), float(scores[i])) for i in top]
+
+    async def rebuild(self, db: AsyncSession):
+        """Load persisted embeddings, backfilling any listings that do not have one yet."""
+        # Read before the rows so a concurrent write can only cause an extra rebuild, never a missed one
+        version = await fetch_jobs_version(db)
+        result = await db.execute(select(JobListing))
+        items = []
+        backfill = []
+        for job in result.scalars():
+            vector: Optional[np.ndarray] = None
+            if job.embedding:
+                vector = self.from_bytes(job.embedding)
+            if vector is None or vector.shape[0] != self.dim:
+                vector = self.embed_job(job)
+                backfill.append({"job_id": job.id, "embedding": self.to_bytes(vector)})
+            items.append((job.id, vector))
+
+        if backfill:
+            # Core UPDATE that sets updated_at to itself, so its onupdate does not fire; bumping it
+            # would change the jobs version and send every worker into another full rebuild
+            table = JobListing.__table__
+            await db.execute(
+                update(table)
+                .where(table.c.id == bindparam("job_id"))
+                .values(embedding=bindparam("embedding"), updated_at=table.c.updated_at),
+                backfill
+            )
+            await db.commit()
+        self.load(items)
+        self.version = version
+        logger.info(f"Job index built with {len(items)} listings ({len(backfill)} backfilled)")
+
+    async def sync(self, db: AsyncSession, version: str):
+        """Rebuild when job_listings changed since the last rebuild, e.g. through another worker."""
+        if version == self.version:
+            return
+        async with self._rebuild_lock:
+            if version != self.version:
+                await self.rebuild(db)
+
+job_index = JobIndex(dim=settings.JOB_EMBEDDING_DIM)
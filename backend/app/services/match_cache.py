@@ -0,0 +1,61 @@
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import json
+import time
+import logging
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.models.resume import JobListing
+
+logger = logging.getLogger(__name__)
+
+async def fetch_jobs_version(db: AsyncSession) -> str:
+    """Fingerprint of job_listings as stored in the database; any create, update or delete from any worker changes it."""
+    row = (await db.execute(select(
+        func.count(JobListing.id),
+        func.max(JobListing.id),
+        func.max(func.coalesce(JobListing.updated_at, JobListing.created_at)),
+    ))).one()
+    return ":".join(str(value) for value in row)
+
+class MatchCache:
+    """In-process TTL cache for job match results, keyed by resume content and job corpus version."""
+
+    def __init__(self, ttl_seconds: int = 3600, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+
+    def make_key(self, resume_id: int, parsed_data: Any, limit: int, jobs_version: str) -> str:
+        if not isinstance(parsed_data, str):
+            parsed_data = json.dumps(parsed_data, sort_keys=True, default=str)
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"{resume_id}:{jobs_version}:{limit}:".encode())
+        digest.update(parsed_data.encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: str, value: Any):
+        if len(self._entries) >= self.max_entries:
+            # Drop the oldest insertion to keep memory bounded
+            self._entries.pop(next(iter(self._entries)), None)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+
+    def invalidate_jobs(self):
+        """Free this worker's entries right away; other workers miss via the jobs_version in their keys."""
+        self._entries.clear()
+        logger.debug("Match cache invalidated")
+
+match_cache = MatchCache(ttl_seconds=settings.MATCH_CACHE_TTL_SECONDS)
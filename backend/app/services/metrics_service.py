@@ -1,7 +1,8 @@
-from prometheus_client import Counter, Histogram, Gauge, generate_latest
+from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
 import time
 import functools
 import logging
+from typing import Any, Dict, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -34,20 +35,34 @@ job_matching_duration = Histogram(
     ['status']
 )
 
+# Labeled children by (metric, label values); .labels() re-validates and hashes its
+# arguments under a lock on every call, so each combination is resolved only once
+_LABELED: Dict[Tuple, Any] = {}
+
+def _labeled(metric, *values):
+    key = (metric, values)
+    child = _LABELED.get(key)
+    if child is None:
+        child = _LABELED[key] = metric.labels(*values)
+    return child
+
 def track_request_metrics(func):
     """Decorator to track HTTP request metrics."""
+    default_endpoint = func.__name__
+    
     @functools.wraps(func)
     async def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         method = "unknown"
-        endpoint = func.__name__
+        endpoint = default_endpoint
         status = "unknown"
         
         try:
-            # Try to extract request info if available
-            if args and hasattr(args[0], 'method'):
-                method = args[0].method
-                endpoint = args[0].url.path
+            # FastAPI passes endpoint parameters by keyword
+            request = kwargs.get('request') or (args[0] if args else None)
+            # endpoint stays the function name: the concrete path would mint a new series per id
+            if hasattr(request, 'method'):
+                method = request.method
             
             result = await func(*args, **kwargs)
             status = "success"
@@ -59,60 +74,49 @@ def track_request_metrics(func):
             raise
             
         finally:
-            duration = time.time() - start_time
-            http_requests_total.labels(
-                method=method,
-                endpoint=endpoint,
-                status=status
-            ).inc()
-            
-            http_request_duration_seconds.labels(
-                method=method,
-                endpoint=endpoint
-            ).observe(duration)
+            duration = time.perf_counter() - start_time
+            _labeled(http_requests_total, method, endpoint, status).inc()
+            _labeled(http_request_duration_seconds, method, endpoint).observe(duration)
     
     return wrapper
 
 def track_resume_parsing(func):
     """Decorator to track resume parsing metrics."""
     @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        start_time = time.time()
+    async def wrapper(*args, **kwargs):
+        start_time = time.perf_counter()
         status = "success"
         
         try:
-            result = func(*args, **kwargs)
-            return result
+            return await func(*args, **kwargs)
         except Exception as e:
             status = "error"
             logger.error(f"Resume parsing failed: {e}")
             raise
         finally:
-            duration = time.time() - start_time
-            resume_parsing_duration.labels(status=status).observe(duration)
+            # Resolved on first use, so no zero-valued error series is exported before a failure
+            _labeled(resume_parsing_duration, status).observe(time.perf_counter() - start_time)
     
     return wrapper
 
 def track_job_matching(func):
     """Decorator to track job matching metrics."""
     @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        start_time = time.time()
+    async def wrapper(*args, **kwargs):
+        start_time = time.perf_counter()
         status = "success"
         
         try:
-            result = func(*args, **kwargs)
-            return result
+            return await func(*args, **kwargs)
         except Exception as e:
             status = "error"
             logger.error(f"Job matching failed: {e}")
             raise
         finally:
-            duration = time.time() - start_time
-            job_matching_duration.labels(status=status).observe(duration)
+            _labeled(job_matching_duration, status).observe(time.perf_counter() - start_time)
     
     return wrapper
 
-def get_metrics():
-    """Get Prometheus metrics in text format."""
+def get_metrics() -> bytes:
+    """Get Prometheus metrics in the exposition format, already encoded."""
     return generate_latest()
\ No newline at end of file
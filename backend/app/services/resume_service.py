@@ -1,22 +1,62 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import io
+import docx2txt
+import httpx
+import orjson
 import spacy
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
+from pdfminer.high_level import extract_text as extract_pdf_text
 import logging
 from app.core.config import settings
+from app.util.keywords import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
+_http_client: Optional[httpx.AsyncClient] = None
+
+def get_http_client() -> httpx.AsyncClient:
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+        )
+    return _http_client
+
+async def close_http_client():
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+def get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        # None means one worker per CPU
+        _process_pool = ProcessPoolExecutor(max_workers=settings.NLP_WORKERS)
+    return _process_pool
+
+def shutdown_process_pool():
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+_SKILL_KEYWORDS = KeywordMatcher([
+    "python", "javascript", "java", "react", "nodejs", "sql", "docker",
+    "kubernetes", "aws", "gcp", "azure", "tensorflow", "pytorch",
+    "machine learning", "data science", "api", "rest", "graphql",
+    "git", "agile", "scrum", "ci/cd", "devops"
+])
+
 class ResumeService:
     def __init__(self):
         try:
             self.nlp = spacy.load(settings.SPACY_MODEL)
-            self.vectorizer = TfidfVectorizer(
-                max_features=5000,
-                stop_words='english',
-                ngram_range=(1, 2)
-            )
             logger.info("Resume service initialized")
         except Exception as e:
             logger.error(f"Failed to initialize resume service: {e}")
@@ -30,17 +70,7 @@ class ResumeService:
             if ent.label_ in ["ORG", "PRODUCT", "LANGUAGE"]:
                 skills.append(ent.text.lower())
         
-        skill_keywords = [
-            "python", "javascript", "java", "react", "nodejs", "sql", "docker",
-            "kubernetes", "aws", "gcp", "azure", "tensorflow", "pytorch",
-            "machine learning", "data science", "api", "rest", "graphql",
-            "git", "agile", "scrum", "ci/cd", "devops"
-        ]
-        
-        text_lower = text.lower()
-        for keyword in skill_keywords:
-            if keyword in text_lower:
-                skills.append(keyword)
+        skills.extend(_SKILL_KEYWORDS.find(text))
         
         return list(set(skills))
 
@@ -85,73 +115,73 @@ class ResumeService:
             logger.error(f"Failed to parse resume content: {e}")
             raise
 
-    def calculate_job_match_score(self, resume_data: Dict[str, Any], job_description: str) -> float:
-        try:
-            resume_text = " ".join([
-                " ".join(resume_data.get("skills", [])),
-                " ".join([exp.get("description", "") for exp in resume_data.get("experience", [])]),
-                resume_data.get("raw_text", "")
-            ])
-            
-            documents = [resume_text, job_description]
-            tfidf_matrix = self.vectorizer.fit_transform(documents)
-            
-            similarity_matrix = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])
-            score = float(similarity_matrix[0][0])
-            
-            return min(max(score, 0.0), 1.0)
-        except Exception as e:
-            logger.error(f"Failed to calculate job match score: {e}")
-            return 0.0
+    def extract_text(self, data: bytes, filename: str) -> str:
+        name = filename.lower()
+        if name.endswith(".pdf"):
+            return extract_pdf_text(io.BytesIO(data))
+        if name.endswith(".docx"):
+            return docx2txt.process(io.BytesIO(data))
+        return data.decode("utf-8", errors="ignore")
 
-    def get_matching_jobs(self, resume_data: Dict[str, Any], job_listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        try:
-            matches = []
-            
-            for job in job_listings:
-                score = self.calculate_job_match_score(resume_data, job.get("description", ""))
-                
-                matches.append({
-                    **job,
-                    "match_score": score,
-                    "matching_skills": list(set(resume_data.get("skills", [])) & 
-                                          set(self.extract_skills(job.get("description", ""))))
-                })
-            
-            matches.sort(key=lambda x: x["match_score"], reverse=True)
-            return matches
-        except Exception as e:
-            logger.error(f"Failed to get matching jobs: {e}")
-            return []
+    def build_match_text(self, resume_data: Dict[str, Any]) -> str:
+        return " ".join([
+            " ".join(resume_data.get("skills", [])),
+            " ".join([exp.get("description", "") for exp in resume_data.get("experience", [])]),
+            resume_data.get("raw_text", "")
+        ])
+
+    async def parse_resume_content_async(self, content: str) -> Dict[str, Any]:
+        """Run spaCy parsing in the worker pool so the event loop keeps serving requests"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_process_pool(), _parse_resume_content, content)
+
+    async def extract_and_parse_async(self, data: bytes, filename: str) -> Tuple[str, Dict[str, Any]]:
+        """Extract text from an uploaded file and parse it, in the worker pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_process_pool(), _extract_and_parse, data, filename)
+
+    async def match_skills_async(self, resume_skills: List[str], descriptions: List[str]) -> List[List[str]]:
+        """Intersect resume skills with those extracted from each description, in the worker pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_process_pool(), _match_skills, resume_skills, descriptions)
 
     async def get_live_job_matches(self, resume_text: str, location: str = "US", limit: int = 20) -> List[Dict[str, Any]]:
         """Get live job matches from the job finder service"""
         try:
-            import httpx
-            from app.core.config import settings
-            
             # Get job finder service URL from environment
             job_finder_url = getattr(settings, 'JOB_FINDER_URL', 'http://localhost:8000')
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    f"{job_finder_url}/jobs/live",
-                    json={
-                        "resume_text": resume_text,
-                        "location": location,
-                        "limit": limit,
-                        "days": 7
-                    }
-                )
-                
-                if response.status_code == 200:
-                    return response.json()
-                else:
-                    logger.error(f"Job finder service error: {response.status_code} - {response.text}")
-                    return []
+            response = await get_http_client().post(
+                f"{job_finder_url}/jobs/live",
+                json={
+                    "resume_text": resume_text,
+                    "location": location,
+                    "limit": limit,
+                    "days": 7
+                }
+            )
+            
+            if response.status_code == 200:
+                return orjson.loads(response.content)
+            else:
+                logger.error(f"Job finder service error: {response.status_code} - {response.text}")
+                return []
                     
         except Exception as e:
             logger.error(f"Failed to get live job matches: {e}")
             return []
 
-resume_service = ResumeService()
\ No newline at end of file
+resume_service = ResumeService()
+
+# Module-level entry points for the process pool: workers resolve their own
+# resume_service on import instead of pickling the spaCy pipeline per call
+def _parse_resume_content(content: str) -> Dict[str, Any]:
+    return resume_service.parse_resume_content(content)
+
+def _extract_and_parse(data: bytes, filename: str) -> Tuple[str, Dict[str, Any]]:
+    content = resume_service.extract_text(data, filename)
+    return content, resume_service.parse_resume_content(content)
+
+def _match_skills(resume_skills: List[str], descriptions: List[str]) -> List[List[str]]:
+    skills = set(resume_skills)
+    return [list(skills & set(resume_service.extract_skills(description))) for description in descriptions]
\ No newline at end of file
@@ -1,9 +1,11 @@
 from google.cloud import secretmanager
 from app.core.config import settings
+import functools
 import logging
 
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=32)
 def get_secret(secret_name: str) -> str:
     try:
         client = secretmanager.SecretManagerServiceClient()
@@ -0,0 +1,71 @@
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Tuple
+import os
+
+try:
+    import ahocorasick
+except ImportError:  # optional C extension; the substring path finds the same matches
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """
+    Finds which of a fixed set of lower-case keywords occur as substrings of a text:
+    one Aho-Corasick pass when pyahocorasick is installed, C substring searches otherwise.
+    Matches come back as a frozenset of keywords, or as an int with bit i set for self.keywords[i].
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: Tuple[str, ...] = tuple(dict.fromkeys(k.lower() for k in keywords if k))
+        self.bits: Dict[str, int] = {keyword: 1 << i for i, keyword in enumerate(self.keywords)}
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for keyword, bit in self.bits.items():
+                self._automaton.add_word(keyword, (keyword, bit))
+            self._automaton.make_automaton()
+        else:
+            self._automaton = None
+            # str.__contains__ is CPython's memchr-driven fastsearch; one C scan per keyword
+            # outruns a single regex pass that has to try the alternation at every offset.
+            # Keywords sharing a leading trigram are gated on their common prefix, so a text
+            # without "financ" skips both "finance" and "financial" after one scan
+            groups: Dict[str, List[Tuple[str, int]]] = {}
+            for keyword, bit in self.bits.items():
+                groups.setdefault(keyword[:3], []).append((keyword, bit))
+            self._groups: Tuple[Tuple[str, Tuple[Tuple[str, int], ...]], ...] = tuple(
+                (os.path.commonprefix([keyword for keyword, _ in items]), tuple(items))
+                for items in groups.values()
+            )
+
+    def find(self, text: str, lowered: bool = False) -> FrozenSet[str]:
+        """Keywords occurring in text; pass lowered=True when the caller already lower-cased it."""
+        if not text or not self.keywords:
+            return frozenset()
+        if not lowered:
+            text = text.lower()
+        if self._automaton is not None:
+            return frozenset(keyword for _, (keyword, _) in self._automaton.iter(text))
+        return frozenset(keyword for keyword, _ in self._scan(text))
+
+    def mask(self, text: str, lowered: bool = False) -> int:
+        """Like find(), but as a bitmask over self.keywords, built without any intermediate set."""
+        if not text or not self.keywords:
+            return 0
+        if not lowered:
+            text = text.lower()
+        found = 0
+        if self._automaton is not None:
+            for _, (_, bit) in self._automaton.iter(text):
+                found |= bit
+        else:
+            for _, bit in self._scan(text):
+                found |= bit
+        return found
+
+    def _scan(self, text: str) -> Iterator[Tuple[str, int]]:
+        for prefix, items in self._groups:
+            if prefix not in text:
+                continue
+            for keyword, bit in items:
+                # A keyword equal to its group prefix was just found by the gate itself
+                if keyword == prefix or keyword in text:
+                    yield keyword, bit
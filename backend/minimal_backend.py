@@ -1,57 +1,77 @@
 #!/usr/bin/env python3
 import http.server
-import socketserver
 import json
 
+try:
+    import orjson
+
+    def dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:  # orjson is optional here; the stdlib encoder produces equivalent JSON
+    def dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 PORT = 8000
 
+# Static mock payloads, serialized once at import
+RESUMES_BODY = dumps([
+    {
+        "id": 1,
+        "filename": "sample_resume.pdf",
+        "upload_date": "2024-01-15T10:30:00Z",
+        "status": "processed",
+        "parsed_data": True
+    }
+])
+
+UPLOAD_BODY = dumps({
+    "message": "Resume uploaded successfully",
+    "resume_id": 1,
+    "filename": "uploaded_resume.pdf"
+})
+
 class SimpleHandler(http.server.SimpleHTTPRequestHandler):
+    # Persistent connections; every response carries Content-Length so the socket can be reused
+    protocol_version = 'HTTP/1.1'
+    # TCP_NODELAY: small JSON responses go out immediately instead of waiting on Nagle
+    disable_nagle_algorithm = True
+    
     def do_OPTIONS(self):
         self.send_response(200)
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization')
+        self.send_header('Content-Length', '0')
         self.end_headers()
     
+    def send_json(self, body: bytes):
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(body)
+    
     def do_GET(self):
         if self.path.startswith('/api/v1/resumes'):
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
-            data = [
-                {
-                    "id": 1,
-                    "filename": "sample_resume.pdf",
-                    "upload_date": "2024-01-15T10:30:00Z",
-                    "status": "processed",
-                    "parsed_data": True
-                }
-            ]
-            self.wfile.write(json.dumps(data).encode())
+            self.send_json(RESUMES_BODY)
         else:
             self.send_response(404)
+            self.send_header('Content-Length', '0')
             self.end_headers()
     
     def do_POST(self):
+        # Drain the request body so the next request on this connection starts clean
+        self.rfile.read(int(self.headers.get('Content-Length', 0)))
         if self.path.startswith('/api/v1/resumes/upload'):
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
-            data = {
-                "message": "Resume uploaded successfully",
-                "resume_id": 1,
-                "filename": "uploaded_resume.pdf"
-            }
-            self.wfile.write(json.dumps(data).encode())
+            self.send_json(UPLOAD_BODY)
         else:
             self.send_response(404)
+            self.send_header('Content-Length', '0')
             self.end_headers()
 
-with socketserver.TCPServer(("", PORT), SimpleHandler) as httpd:
+# One thread per connection, so a slow client no longer blocks every other request
+with http.server.ThreadingHTTPServer(("", PORT), SimpleHandler) as httpd:
     print(f"Server running on port {PORT}")
     httpd.serve_forever()
 
@@ -1,151 +1,261 @@
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import json
+import logging
+import multiprocessing
+import socket
 import urllib.parse
 from urllib.parse import urlparse, parse_qs
 import os
 import sys
 
+try:
+    import orjson
+
+    def dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:  # orjson is optional here; the stdlib encoder produces equivalent JSON
+    def dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+logger = logging.getLogger(__name__)
+
+# Mock payloads never change, so they are serialized once at import and written as-is
+RESUMES = [
+    {
+        "id": 1,
+        "filename": "sample_resume.pdf",
+        "upload_date": "2024-01-15T10:30:00Z",
+        "status": "processed",
+        "parsed_data": True
+    }
+]
+
+MATCHES = [
+    {
+        "id": 1,
+        "job_listing": {
+            "title": "Software Engineer",
+            "company": "Tech Corp",
+            "location": "San Francisco, CA",
+            "description": "We are looking for a talented software engineer...",
+            "salary_min": 80000,
+            "salary_max": 120000,
+            "job_type": "Full-time",
+            "remote": "Hybrid"
+        },
+        "match_score": 0.85,
+        "matching_skills": ["Python", "JavaScript", "React", "FastAPI"]
+    },
+    {
+        "id": 2,
+        "job_listing": {
+            "title": "Full Stack Developer",
+            "company": "Startup Inc",
+            "location": "Remote",
+            "description": "Join our growing team as a full stack developer...",
+            "salary_min": 70000,
+            "salary_max": 100000,
+            "job_type": "Full-time",
+            "remote": "Remote"
+        },
+        "match_score": 0.78,
+        "matching_skills": ["Python", "JavaScript", "SQL", "Docker"]
+    }
+]
+
+UPLOAD_RESPONSE = {
+    "message": "Resume uploaded successfully",
+    "resume_id": 1,
+    "filename": "uploaded_resume.pdf"
+}
+
+FIND_MATCHES_RESPONSE = {
+    "message": "Job matches found successfully",
+    "matches_count": 5,
+    "resume_id": 1
+}
+
+RESUMES_BODY = dumps(RESUMES)
+MATCHES_BODY = dumps(MATCHES)
+UPLOAD_BODY = dumps(UPLOAD_RESPONSE)
+FIND_MATCHES_BODY = dumps(FIND_MATCHES_RESPONSE)
+
+# Uploads are never kept, so bodies are drained in fixed-size chunks and anything too large is refused
+MAX_BODY_BYTES = 16 * 1024 * 1024
+READ_CHUNK_BYTES = 64 * 1024
+TOO_LARGE_BODY = dumps({"error": "Request body too large"})
+BAD_LENGTH_BODY = dumps({"error": "Invalid Content-Length header"})
+
+def get_resumes(path):
+    # Mock resumes data
+    logger.debug("Returning resumes: %s", RESUMES)
+    return RESUMES_BODY
+
+def get_matches(path):
+    # Mock job matches data
+    logger.debug("Returning matches: %d matches", len(MATCHES))
+    return MATCHES_BODY
+
+def get_unknown(path):
+    logger.debug("Unknown path: %s", path)
+    return dumps({"message": "Mock API endpoint", "path": path})
+
+def upload_resume(path):
+    # Mock file upload response
+    logger.debug("File upload response: %s", UPLOAD_RESPONSE)
+    return UPLOAD_BODY
+
+def find_matches(path):
+    # Mock job matching response
+    logger.debug("Job matching response: %s", FIND_MATCHES_RESPONSE)
+    return FIND_MATCHES_BODY
+
+def post_unknown(path):
+    logger.debug("Unknown POST path: %s", path)
+    return dumps({"message": "Mock POST endpoint", "path": path})
+
+# Exact paths are a single dict lookup; the few id-carrying routes fall back to a prefix scan
+GET_ROUTES = {
+    '/api/v1/resumes': get_resumes,
+    '/api/v1/resumes/': get_resumes,
+}
+GET_PREFIXES = (('/api/v1/matches/', get_matches),)
+
+POST_ROUTES = {
+    '/api/v1/resumes/upload': upload_resume,
+}
+POST_PREFIXES = (('/api/v1/matches/find/', find_matches),)
+
+def resolve(routes, prefixes, path, default):
+    handler = routes.get(path)
+    if handler is None:
+        handler = next((h for prefix, h in prefixes if path.startswith(prefix)), default)
+    return handler
+
 class MockBackendHandler(BaseHTTPRequestHandler):
+    # Persistent connections; every response carries Content-Length so the socket can be reused
+    protocol_version = 'HTTP/1.1'
+    # TCP_NODELAY: small JSON responses go out immediately instead of waiting on Nagle
+    disable_nagle_algorithm = True
+    
     def log_message(self, format, *args):
-        # Custom logging to see what's happening
-        print(f"[{self.address_string()}] {format % args}")
+        # Access log goes through logging, so the format is only applied when DEBUG is enabled
+        logger.debug("[%s] " + format, self.address_string(), *args)
     
     def do_OPTIONS(self):
         self.send_response(200)
         self.send_header('Access-Control-Allow-Origin', '*')
         self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
         self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization')
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+    
+    def send_json(self, body: bytes, status: int = 200):
+        self.send_response(status)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        if self.close_connection:
+            self.send_header('Connection', 'close')
         self.end_headers()
+        self.wfile.write(body)
     
     def do_GET(self):
         try:
             parsed_url = urlparse(self.path)
             path = parsed_url.path
             
-            print(f"GET request to: {path}")
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
+            logger.debug("GET request to: %s", path)
             
-            if path == '/api/v1/resumes' or path == '/api/v1/resumes/':
-                # Mock resumes data
-                response = [
-                    {
-                        "id": 1,
-                        "filename": "sample_resume.pdf",
-                        "upload_date": "2024-01-15T10:30:00Z",
-                        "status": "processed",
-                        "parsed_data": True
-                    }
-                ]
-                print(f"Returning resumes: {response}")
-            elif path.startswith('/api/v1/matches/'):
-                # Mock job matches data
-                response = [
-                    {
-                        "id": 1,
-                        "job_listing": {
-                            "title": "Software Engineer",
-                            "company": "Tech Corp",
-                            "location": "San Francisco, CA",
-                            "description": "We are looking for a talented software engineer...",
-                            "salary_min": 80000,
-                            "salary_max": 120000,
-                            "job_type": "Full-time",
-                            "remote": "Hybrid"
-                        },
-                        "match_score": 0.85,
-                        "matching_skills": ["Python", "JavaScript", "React", "FastAPI"]
-                    },
-                    {
-                        "id": 2,
-                        "job_listing": {
-                            "title": "Full Stack Developer",
-                            "company": "Startup Inc",
-                            "location": "Remote",
-                            "description": "Join our growing team as a full stack developer...",
-                            "salary_min": 70000,
-                            "salary_max": 100000,
-                            "job_type": "Full-time",
-                            "remote": "Remote"
-                        },
-                        "match_score": 0.78,
-                        "matching_skills": ["Python", "JavaScript", "SQL", "Docker"]
-                    }
-                ]
-                print(f"Returning matches: {len(response)} matches")
-            else:
-                response = {"message": "Mock API endpoint", "path": path}
-                print(f"Unknown path: {path}")
-            
-            self.wfile.write(json.dumps(response).encode())
+            handler = resolve(GET_ROUTES, GET_PREFIXES, path, get_unknown)
+            self.send_json(handler(path))
         except Exception as e:
-            print(f"Error in GET request: {e}")
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps({"error": str(e)}).encode())
+            logger.error("Error in GET request: %s", e)
+            self.send_json(dumps({"error": str(e)}), 500)
+    
+    def drain_body(self) -> bool:
+        try:
+            remaining = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            remaining = -1
+        if remaining < 0:
+            # Body length is unknown, so the rest of the stream cannot be framed; drop the connection
+            self.close_connection = True
+            self.send_json(BAD_LENGTH_BODY, 400)
+            return False
+        if remaining > MAX_BODY_BYTES:
+            # The unread body would be parsed as the next request, so drop the connection instead
+            self.close_connection = True
+            self.send_json(TOO_LARGE_BODY, 413)
+            return False
+        while remaining > 0:
+            chunk = self.rfile.read(min(remaining, READ_CHUNK_BYTES))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+        return True
     
     def do_POST(self):
         try:
-            content_length = int(self.headers['Content-Length'])
-            post_data = self.rfile.read(content_length)
+            if not self.drain_body():
+                return
             
             parsed_url = urlparse(self.path)
             path = parsed_url.path
             
-            print(f"POST request to: {path}")
-            
-            self.send_response(200)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
+            logger.debug("POST request to: %s", path)
             
-            if path == '/api/v1/resumes/upload':
-                # Mock file upload response
-                response = {
-                    "message": "Resume uploaded successfully",
-                    "resume_id": 1,
-                    "filename": "uploaded_resume.pdf"
-                }
-                print(f"File upload response: {response}")
-            elif path.startswith('/api/v1/matches/find/'):
-                # Mock job matching response
-                response = {
-                    "message": "Job matches found successfully",
-                    "matches_count": 5,
-                    "resume_id": 1
-                }
-                print(f"Job matching response: {response}")
-            else:
-                response = {"message": "Mock POST endpoint", "path": path}
-                print(f"Unknown POST path: {path}")
-            
-            self.wfile.write(json.dumps(response).encode())
+            handler = resolve(POST_ROUTES, POST_PREFIXES, path, post_unknown)
+            self.send_json(handler(path))
         except Exception as e:
-            print(f"Error in POST request: {e}")
-            self.send_response(500)
-            self.send_header('Content-type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(json.dumps({"error": str(e)}).encode())
+            logger.error("Error in POST request: %s", e)
+            self.send_json(dumps({"error": str(e)}), 500)
+
+class ReusePortHTTPServer(ThreadingHTTPServer):
+    def server_bind(self):
+        # Each worker process binds its own listening socket to the same port and the kernel
+        # load-balances new connections across them
+        if hasattr(socket, 'SO_REUSEPORT'):
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+def setup_logging():
+    # Per-request messages are DEBUG; set LOG_LEVEL=DEBUG to see them
+    logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO'), format='%(asctime)s %(levelname)s %(message)s')
 
 def run_server():
+    # Runs in each worker process, which does not inherit the parent's handlers under the spawn start method
+    setup_logging()
     try:
         server_address = ('', 8000)
-        httpd = HTTPServer(server_address, MockBackendHandler)
-        print("Mock backend server running on http://localhost:8000")
-        print("Press Ctrl+C to stop")
+        # One thread per connection, so a slow client no longer blocks every other request
+        httpd = ReusePortHTTPServer(server_address, MockBackendHandler)
+        logger.info("Mock backend server running on http://localhost:8000 (pid %d)", os.getpid())
+        logger.info("Press Ctrl+C to stop")
         httpd.serve_forever()
     except KeyboardInterrupt:
-        print("\nShutting down server...")
+        logger.info("Shutting down server...")
         httpd.shutdown()
     except Exception as e:
-        print(f"Server error: {e}")
+        logger.error("Server error: %s", e)
         sys.exit(1)
 
+def run_workers(workers: int):
+    # Without SO_REUSEPORT only the first bind would succeed, so fall back to a single process
+    if workers <= 1 or not hasattr(socket, 'SO_REUSEPORT'):
+        run_server()
+        return
+    processes = [multiprocessing.Process(target=run_server) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        # Ctrl+C reaches every worker in the process group; wait for them to finish shutting down
+        for process in processes:
+            process.join()
+
 if __name__ == '__main__':
-    run_server()
+    # One process unless WORKERS asks for more, e.g. WORKERS=$(nproc)
+    run_workers(int(os.environ.get('WORKERS', 1)))
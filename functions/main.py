@@ -4,6 +4,15 @@ from google.cloud import storage
 import tempfile
 import os
 
+# Warm instances reuse the client (and its credentials and HTTP session) across invocations
+_storage_client = None
+
+def get_storage_client():
+    global _storage_client
+    if _storage_client is None:
+        _storage_client = storage.Client()
+    return _storage_client
+
 @functions_framework.cloud_event
 def parse_resume(cloud_event):
     """Cloud Function to parse resume PDF and extract text."""
@@ -12,8 +21,7 @@ def parse_resume(cloud_event):
     bucket_name = cloud_event.data["bucket"]
     file_name = cloud_event.data["name"]
     
-    # Initialize Cloud Storage client
-    storage_client = storage.Client()
+    storage_client = get_storage_client()
     bucket = storage_client.bucket(bucket_name)
     blob = bucket.blob(file_name)
     